@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Persistent Blender import worker.
+
+Started once per batch inside Blender and driven by JSON commands on stdin:
+    blender --background --python blender_worker.py
+
+Commands (one JSON object per line):
+    {"cmd": "import", "pcb3d": "<pcb3d_path>", "blend": "<blend_path>"}
+    {"cmd": "quit"}
+
+Every command is answered with exactly one line starting with RESPONSE_PREFIX,
+so the caller can tell replies apart from Blender's own stdout output.
+"""
+
+import json
+import sys
+import traceback
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import bpy
+
+# Import modules directly to avoid triggering __init__.py
+import pcb_dataset.importer as importer_module
+
+BlenderImporter = importer_module.BlenderImporter
+
+RESPONSE_PREFIX = "@@PCB_WORKER@@"
+
+
+def respond(payload: dict):
+    """Write a single response line back to the parent process."""
+    sys.stdout.write(f"{RESPONSE_PREFIX} {json.dumps(payload)}\n")
+    sys.stdout.flush()
+
+
+def handle_import(importer: BlenderImporter, command: dict) -> dict:
+    """Import one .pcb3d and save it as .blend, then drop leftover datablocks."""
+    result_path = importer.import_pcb3d(Path(command["pcb3d"]), Path(command["blend"]))
+
+    # Objects are deleted at the start of every import, but their meshes,
+    # materials and images stay around as orphans - purge them so memory does
+    # not grow across the batch.
+    bpy.data.orphans_purge(do_recursive=True)
+
+    return {"status": "ok", "blend": str(result_path)}
+
+
+def main():
+    importer = BlenderImporter()
+    respond({"status": "ready"})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            command = json.loads(line)
+        except json.JSONDecodeError as e:
+            respond({"status": "error", "error": f"Invalid command: {e}"})
+            continue
+
+        cmd = command.get("cmd")
+        if cmd == "quit":
+            respond({"status": "ok"})
+            break
+
+        if cmd == "import":
+            try:
+                respond(handle_import(importer, command))
+            except Exception as e:
+                traceback.print_exc()
+                sys.stdout.flush()
+                respond({"status": "error", "error": str(e)})
+        else:
+            respond({"status": "error", "error": f"Unknown command: {cmd}"})
+
+
+if __name__ == "__main__":
+    main()
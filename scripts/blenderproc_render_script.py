@@ -6,31 +6,37 @@ import blenderproc as bproc
 Standalone BlenderProc rendering script.
 
 This script is run via blenderproc:
-    blenderproc run blenderproc_render_script.py <blend_path> <output_dir> <config_dir>
+    blenderproc run blenderproc_render_script.py <blend_path> [<blend_path> ...] <output_dir> --config-dir <config_dir>
+
+Several .blend files can be passed to render them in one BlenderProc session.
+The result is reported on a single line starting with RESULT_PREFIX, mapping
+each .blend path to its HDF5 file (or null if that render failed).
 """
 
 import sys
 import argparse
+import json
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 # Import modules directly to avoid triggering __init__.py imports
-# (which would require 'noise' package in Blender's Python)
+# (which would pull in placement dependencies Blender's Python doesn't need)
 import pcb_dataset.renderer as renderer
 import pcb_dataset.utils.config as config_utils
 import pcb_dataset.utils.logging as logging_utils
 
 BProcRenderer = renderer.BProcRenderer
 RenderConfig = renderer.RenderConfig
+RESULT_PREFIX = renderer.RESULT_PREFIX
 load_config = config_utils.load_config
 setup_logging = logging_utils.setup_logging
 
 
 def main():
     parser = argparse.ArgumentParser(description="BlenderProc PCB rendering with segmentation")
-    parser.add_argument("blend_path", type=Path, help="Path to .blend file")
+    parser.add_argument("blend_paths", type=Path, nargs="+", help="Path(s) to .blend files")
     parser.add_argument("output_dir", type=Path, help="Output directory for HDF5 files")
     parser.add_argument("--config-dir", type=Path, default=Path(__file__).parent.parent / "config", help="Config directory")
     parser.add_argument("--log-level", type=str, default="INFO", help="Log level")
@@ -46,9 +52,18 @@ def main():
     # Render
     renderer = BProcRenderer(render_config)
     try:
-        output_path = renderer.render(args.blend_path, args.output_dir)
-        print(f"Success: {output_path}")
-        sys.exit(0)
+        if len(args.blend_paths) == 1:
+            output_paths = [renderer.render(args.blend_paths[0], args.output_dir)]
+        else:
+            output_paths = renderer.render_batch(args.blend_paths, args.output_dir)
+
+        results = {
+            str(blend_path): str(output_path) if output_path else None
+            for blend_path, output_path in zip(args.blend_paths, output_paths)
+        }
+        print(f"{RESULT_PREFIX} {json.dumps(results)}", flush=True)
+        print(f"Success: {sum(1 for p in output_paths if p)}/{len(output_paths)} rendered")
+        sys.exit(0 if all(output_paths) else 2)
     except Exception as e:
         print(f"Error: {e}")
         import traceback
@@ -61,29 +61,28 @@ def main():
     render_config = RenderConfig.from_dict(render_config_dict)
     pipeline_config = PipelineConfig.from_dict(pipeline_config_dict)
 
-    # Initialize pipeline
-    pipeline = Pipeline(
+    # Initialize pipeline (closing it shuts down its Blender worker)
+    with Pipeline(
         placement_config=placement_config,
         render_config=render_config,
         pipeline_config=pipeline_config,
         base_dir=args.output_dir,
-    )
-
-    # Generate samples
-    success_count = 0
-    failed_samples = []
+    ) as pipeline:
+        # Generate samples
+        success_count = 0
+        failed_samples = []
 
-    for i in range(args.num_samples):
-        sample_id = args.start_id + i
+        for i in range(args.num_samples):
+            sample_id = args.start_id + i
 
-        logger.info(f"Generating sample {sample_id} ({i+1}/{args.num_samples})")
+            logger.info(f"Generating sample {sample_id} ({i+1}/{args.num_samples})")
 
-        output_path = pipeline.generate_sample(sample_id)
+            output_path = pipeline.generate_sample(sample_id)
 
-        if output_path:
-            success_count += 1
-        else:
-            failed_samples.append(sample_id)
+            if output_path:
+                success_count += 1
+            else:
+                failed_samples.append(sample_id)
 
     # Summary
     logger.info("=" * 60)
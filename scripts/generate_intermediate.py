@@ -12,10 +12,13 @@ Output: .blend files ready for GPU rendering
 
 Usage:
     python scripts/generate_intermediate.py --num-samples 100 --output-dir data/intermediate
+    python scripts/generate_intermediate.py --num-samples 1000 --workers 8
 """
 
 import argparse
+import multiprocessing.util
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add src to path
@@ -28,9 +31,13 @@ from pcb_dataset.importer import BlenderImporter
 from pcb_dataset.utils.config import load_config
 from pcb_dataset.utils.logging import setup_logging, get_logger
 from pcb_dataset.utils.paths import PathManager
-from pcb_dataset.utils.validation import validate_kicad_file, validate_pcb3d_file
+from pcb_dataset.utils.validation import (
+    validate_kicad_file,
+    validate_pcb3d_file,
+    validate_output,
+)
+from pcb_dataset.blender_worker import BlenderWorker
 from pcb_dataset.pipeline import PipelineConfig
-import subprocess
 
 logger = get_logger(__name__)
 
@@ -40,6 +47,7 @@ def generate_intermediate_sample(
     placer: PerlinPlacer,
     board_creator: BoardCreator,
     exporter: PCB3DExporter,
+    blender_worker: BlenderWorker,
     paths: PathManager,
     placement_config: PlacementConfig,
     pipeline_config: PipelineConfig,
@@ -53,6 +61,7 @@ def generate_intermediate_sample(
         placer: Component placer instance
         board_creator: Board creator instance
         exporter: PCB3D exporter instance
+        blender_worker: Persistent Blender worker used for the import step
         paths: Path manager instance
         placement_config: Placement configuration
         pipeline_config: Pipeline configuration
@@ -87,11 +96,13 @@ def generate_intermediate_sample(
             board_name=f"sample_{sample_id:06d}",
             board_width=placement_config.board_width,
             board_height=placement_config.board_height,
+            seed=seed,
         )
 
-        # Validate board
+        # Validate board (full format checks only with deep_validate)
+        deep_validate = pipeline_config.validation.get("deep_validate", False)
         if pipeline_config.validation.get("check_file_sizes", True):
-            if not validate_kicad_file(board_path):
+            if not validate_output(board_path, validate_kicad_file, deep=deep_validate):
                 raise RuntimeError(f"Board validation failed: {board_path}")
         logger.info(f"  Board created: {board_path}")
 
@@ -102,14 +113,16 @@ def generate_intermediate_sample(
 
         # Validate .pcb3d
         if pipeline_config.validation.get("check_file_sizes", True):
-            if not validate_pcb3d_file(pcb3d_path):
+            if not validate_output(pcb3d_path, validate_pcb3d_file, deep=deep_validate):
                 raise RuntimeError(f".pcb3d validation failed: {pcb3d_path}")
         logger.info(f"  .pcb3d exported: {pcb3d_path}")
 
         # Step 4: Import to Blender
         logger.info("Step 4: Importing to Blender...")
         blend_path = paths.get_blend_path(sample_id)
-        _run_blender_import(pcb3d_path, blend_path)
+        blender_worker.request(
+            {"cmd": "import", "pcb3d": str(pcb3d_path), "blend": str(blend_path)}
+        )
         logger.info(f"  Blender import complete: {blend_path}")
 
         logger.info(f"✅ Sample {sample_id} intermediate generation complete: {blend_path}")
@@ -120,39 +133,32 @@ def generate_intermediate_sample(
         return None
 
 
-def _run_blender_import(pcb3d_path: Path, blend_path: Path):
-    """
-    Run Blender import in subprocess.
-
-    Args:
-        pcb3d_path: Input .pcb3d file
-        blend_path: Output .blend file
-    """
-    import_script = Path(__file__).parent / "blender_import_script.py"
-
-    cmd = [
-        "blender",
-        "--background",
-        "--python",
-        str(import_script),
-        "--",
-        str(pcb3d_path),
-        str(blend_path),
-    ]
+# Per-process modules when running with --workers > 1 (set by _init_worker)
+_worker_state = {}
 
-    logger.debug(f"Running: {' '.join(cmd)}")
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+def _init_worker(placement_config, pipeline_config, output_dir, worker_script):
+    """Build the pipeline modules for one pool process, with its own Blender worker."""
+    blender_worker = BlenderWorker(
+        worker_script, timeout=pipeline_config.performance.get("blender_timeout", 1800)
+    )
+    multiprocessing.util.Finalize(blender_worker, blender_worker.close, exitpriority=10)
+
+    _worker_state.update(
+        placer=PerlinPlacer(placement_config),
+        board_creator=BoardCreator(),
+        exporter=PCB3DExporter(),
+        blender_worker=blender_worker,
+        paths=PathManager(output_dir, pipeline_config.paths),
+        placement_config=placement_config,
+        pipeline_config=pipeline_config,
+        base_seed=pipeline_config.base_seed,
+    )
 
-    # Log stdout for debugging
-    if result.stdout:
-        logger.debug(f"Blender import stdout: {result.stdout}")
 
-    if result.returncode != 0:
-        logger.error(f"Blender import failed (returncode={result.returncode})")
-        logger.error(f"stderr: {result.stderr}")
-        logger.error(f"stdout: {result.stdout}")
-        raise RuntimeError(f"Blender import failed: {result.stderr}")
+def _generate_in_worker(sample_id: int):
+    """Pool task: generate one sample with this process's modules."""
+    return sample_id, generate_intermediate_sample(sample_id=sample_id, **_worker_state)
 
 
 def main():
@@ -178,6 +184,12 @@ def main():
         "--log-level", type=str, default="INFO", help="Log level (DEBUG, INFO, WARNING, ERROR)"
     )
     parser.add_argument("--start-id", type=int, default=0, help="Starting sample ID")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (each runs its own Blender worker)",
+    )
     args = parser.parse_args()
 
     # Setup logging
@@ -196,38 +208,56 @@ def main():
 
     # Initialize path manager
     paths = PathManager(args.output_dir, pipeline_config.paths)
-
-    # Initialize modules (CPU-only)
-    placer = PerlinPlacer(placement_config)
-    board_creator = BoardCreator()
-    exporter = PCB3DExporter()
-
-    logger.info("Modules initialized (CPU-only pipeline)")
+    worker_script = Path(__file__).parent / "blender_worker.py"
 
     # Generate intermediate files
     success_count = 0
     failed_samples = []
-
-    for i in range(args.num_samples):
-        sample_id = args.start_id + i
-
-        logger.info(f"\nProcessing sample {sample_id} ({i+1}/{args.num_samples})")
-
-        blend_path = generate_intermediate_sample(
-            sample_id=sample_id,
-            placer=placer,
-            board_creator=board_creator,
-            exporter=exporter,
-            paths=paths,
-            placement_config=placement_config,
-            pipeline_config=pipeline_config,
-            base_seed=pipeline_config.base_seed,
-        )
-
-        if blend_path:
-            success_count += 1
-        else:
-            failed_samples.append(sample_id)
+    sample_ids = range(args.start_id, args.start_id + args.num_samples)
+
+    if args.workers > 1:
+        # Samples are independent - fan them out over a process pool
+        logger.info(f"Using {args.workers} worker processes")
+
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_worker,
+            initargs=(placement_config, pipeline_config, args.output_dir, worker_script),
+        ) as pool:
+            for sample_id, blend_path in pool.map(_generate_in_worker, sample_ids, chunksize=4):
+                if blend_path:
+                    success_count += 1
+                else:
+                    failed_samples.append(sample_id)
+    else:
+        # Initialize modules (CPU-only)
+        placer = PerlinPlacer(placement_config)
+        board_creator = BoardCreator()
+        exporter = PCB3DExporter()
+        # Closing the worker shuts down its Blender process, even on errors
+        blender_timeout = pipeline_config.performance.get("blender_timeout", 1800)
+        with BlenderWorker(worker_script, timeout=blender_timeout) as blender_worker:
+            logger.info("Modules initialized (CPU-only pipeline)")
+
+            for i, sample_id in enumerate(sample_ids):
+                logger.info(f"\nProcessing sample {sample_id} ({i+1}/{args.num_samples})")
+
+                blend_path = generate_intermediate_sample(
+                    sample_id=sample_id,
+                    placer=placer,
+                    board_creator=board_creator,
+                    exporter=exporter,
+                    blender_worker=blender_worker,
+                    paths=paths,
+                    placement_config=placement_config,
+                    pipeline_config=pipeline_config,
+                    base_seed=pipeline_config.base_seed,
+                )
+
+                if blend_path:
+                    success_count += 1
+                else:
+                    failed_samples.append(sample_id)
 
     # Summary
     logger.info("=" * 60)
@@ -54,16 +54,15 @@ def main():
     render_config = RenderConfig.from_dict(render_config_dict)
     pipeline_config = PipelineConfig.from_dict(pipeline_config_dict)
 
-    # Initialize pipeline
-    pipeline = Pipeline(
+    # Initialize pipeline (closing it shuts down its Blender worker)
+    with Pipeline(
         placement_config=placement_config,
         render_config=render_config,
         pipeline_config=pipeline_config,
         base_dir=args.output_dir,
-    )
-
-    # Generate sample
-    output_path = pipeline.generate_sample(args.sample_id)
+    ) as pipeline:
+        # Generate sample
+        output_path = pipeline.generate_sample(args.sample_id)
 
     if output_path:
         print(f"Success: {output_path}")
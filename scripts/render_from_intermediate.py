@@ -12,67 +12,59 @@ Output: HDF5 files with RGB, depth, segmentation + optional PNG/COCO
 
 Usage:
     python scripts/render_from_intermediate.py --num-samples 100 --input-dir data/intermediate
+    python scripts/render_from_intermediate.py --num-samples 100 --input-dir data/intermediate --batch-size 16
+    python scripts/render_from_intermediate.py --num-samples 1000 --input-dir data/intermediate --num-gpus 4
 """
 
 import argparse
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from pcb_dataset.renderer import BProcRenderer, RenderConfig
+from pcb_dataset.renderer import RenderConfig, run_render_process
 from pcb_dataset.converter import FormatConverter
 from pcb_dataset.utils.config import load_config
 from pcb_dataset.utils.logging import setup_logging, get_logger
 from pcb_dataset.utils.paths import PathManager
-from pcb_dataset.utils.validation import validate_hdf5_file
+from pcb_dataset.utils.validation import validate_hdf5_file, validate_output
 from pcb_dataset.pipeline import PipelineConfig
-import subprocess
 
 logger = get_logger(__name__)
 
 
-def render_from_blend(
+def process_rendered_output(
     sample_id: int,
-    blend_path: Path,
+    output_path: Path,
     paths: PathManager,
-    render_config: RenderConfig,
     pipeline_config: PipelineConfig,
     converter: FormatConverter,
 ):
     """
-    Render final output from intermediate .blend file.
+    Validate a rendered HDF5 file and run the PNG/COCO conversion steps.
 
     Args:
         sample_id: Sample ID
-        blend_path: Path to input .blend file
+        output_path: Rendered HDF5 file for this sample
         paths: Path manager instance
-        render_config: Render configuration
         pipeline_config: Pipeline configuration
         converter: Format converter instance
 
     Returns:
         Path to generated output file (or None if failed)
     """
-    logger.info(f"=" * 60)
-    logger.info(f"Rendering sample {sample_id} from {blend_path.name}")
-    logger.info(f"=" * 60)
-
     try:
-        # Check that blend file exists
-        if not blend_path.exists():
-            raise FileNotFoundError(f"Blend file not found: {blend_path}")
-
-        # Step 5: Render with segmentation (GPU)
-        logger.info("Step 5: Rendering with segmentation (GPU)...")
-        output_path = _run_blender_render(blend_path, sample_id, paths, render_config)
-        logger.info(f"  Rendered: {output_path}")
-
         # Validate output
         if pipeline_config.validation.get("check_file_sizes", True):
             min_size_mb = pipeline_config.validation.get("min_output_size_mb", 1.0)
-            if not validate_hdf5_file(output_path, min_size_mb=min_size_mb):
+            deep_validate = pipeline_config.validation.get("deep_validate", False)
+            if not validate_output(
+                output_path, validate_hdf5_file, deep=deep_validate, min_size_mb=min_size_mb
+            ):
                 raise RuntimeError(f"Output validation failed: {output_path}")
 
         # Step 6: Extract PNG images for visualization
@@ -95,56 +87,105 @@ def render_from_blend(
         return None
 
 
-def _run_blender_render(
-    blend_path: Path, sample_id: int, paths: PathManager, render_config: RenderConfig
-) -> Path:
+def _run_blender_render_batch(
+    samples: List[Tuple[int, Path]],
+    paths: PathManager,
+    render_config: RenderConfig,
+    gpu: Optional[int] = None,
+) -> Dict[int, Path]:
     """
-    Run BlenderProc rendering in subprocess.
+    Render several .blend files in a single BlenderProc process.
+
+    BlenderProc startup and scene initialization dominate short renders, so
+    the render script is given the whole batch and reports which HDF5 file
+    each .blend produced.
 
     Args:
-        blend_path: Input .blend file
-        sample_id: Sample ID
+        samples: (sample_id, blend_path) pairs to render
         paths: Path manager instance
         render_config: Render configuration
+        gpu: Restrict the render process to this GPU index (via
+            CUDA_VISIBLE_DEVICES); None uses the default device selection
 
     Returns:
-        Path to generated HDF5 file
+        Dict mapping sample ID to its HDF5 file, for the samples that rendered
     """
-    render_script = Path(__file__).parent / "blenderproc_render_script.py"
-    config_dir = Path(__file__).parent.parent / "config"
-
-    cmd = [
-        "blenderproc",
-        "run",
-        str(render_script),
-        str(blend_path),
-        str(paths.output_dir),
-        "--config-dir",
-        str(config_dir),
-    ]
+    # Concurrent processes write the same <frame>.hdf5 names, so each GPU
+    # writes into its own staging directory before the final rename
+    render_dir = paths.output_dir
+    if gpu is not None:
+        render_dir = paths.output_dir / f".render_gpu{gpu}"
+
+    rendered = run_render_process([blend_path for _, blend_path in samples], render_dir, gpu=gpu)
+
+    output_paths = {}
+    for sample_id, blend_path in samples:
+        hdf5_path = rendered.get(str(blend_path))
+        if hdf5_path is None:
+            logger.error(f"BlenderProc render failed for sample {sample_id}: {blend_path}")
+            continue
 
-    logger.debug(f"Running: {' '.join(cmd)}")
+        # Rename to expected output path
+        output_path = paths.get_output_path(sample_id, resolution=render_config.resolution)
+        hdf5_path.rename(output_path)
+        logger.debug(f"Renamed {hdf5_path} -> {output_path.name}")
+        output_paths[sample_id] = output_path
+
+    return output_paths
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
 
-    if result.returncode != 0:
-        logger.error(f"BlenderProc render failed: {result.stderr}")
-        raise RuntimeError(f"BlenderProc render failed: {result.stderr}")
+def _render_batches(
+    batches: List[List[Tuple[int, Path]]],
+    paths: PathManager,
+    render_config: RenderConfig,
+    num_gpus: int,
+):
+    """
+    Render batches with one BlenderProc process per GPU at a time.
 
-    # Find the generated output file
-    output_path = paths.get_output_path(sample_id, resolution=render_config.resolution)
+    Rendering is embarrassingly parallel across .blend files, so running an
+    independent process on each GPU scales better than letting Cycles split
+    every short render across all devices.
 
-    # BlenderProc creates numbered files, find the latest HDF5 in output dir
-    hdf5_files = sorted(paths.output_dir.glob("*.hdf5"), key=lambda p: p.stat().st_mtime)
-    if hdf5_files:
-        latest_hdf5 = hdf5_files[-1]
-        # Rename to expected output path
-        latest_hdf5.rename(output_path)
-        logger.debug(f"Renamed {latest_hdf5.name} -> {output_path.name}")
-    else:
-        raise RuntimeError("No HDF5 output file generated")
+    Args:
+        batches: Lists of (sample_id, blend_path) pairs
+        paths: Path manager instance
+        render_config: Render configuration
+        num_gpus: Number of GPUs to render on concurrently (1 = default device)
 
-    return output_path
+    Yields:
+        (batch, output_paths) as each batch finishes
+    """
+    if num_gpus <= 1:
+        for batch in batches:
+            yield batch, _render_batch_safe(batch, paths, render_config)
+        return
+
+    # Each in-flight batch holds one GPU index until it finishes
+    free_gpus = queue.Queue()
+    for gpu in range(num_gpus):
+        free_gpus.put(gpu)
+
+    def render_on_free_gpu(batch):
+        gpu = free_gpus.get()
+        try:
+            return _render_batch_safe(batch, paths, render_config, gpu=gpu)
+        finally:
+            free_gpus.put(gpu)
+
+    with ThreadPoolExecutor(max_workers=num_gpus) as pool:
+        futures = {pool.submit(render_on_free_gpu, batch): batch for batch in batches}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def _render_batch_safe(batch, paths, render_config, gpu=None) -> Dict[int, Path]:
+    """_run_blender_render_batch that logs a failed process and reports no outputs."""
+    try:
+        return _run_blender_render_batch(batch, paths, render_config, gpu=gpu)
+    except Exception as e:
+        logger.error(f"❌ Batch rendering failed: {e}", exc_info=True)
+        return {}
 
 
 def main():
@@ -176,6 +217,18 @@ def main():
         "--log-level", type=str, default="INFO", help="Log level (DEBUG, INFO, WARNING, ERROR)"
     )
     parser.add_argument("--start-id", type=int, default=0, help="Starting sample ID")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=8,
+        help="Number of .blend files rendered per BlenderProc process",
+    )
+    parser.add_argument(
+        "--num-gpus",
+        type=int,
+        default=1,
+        help="Number of GPUs to render on concurrently (one BlenderProc process each)",
+    )
     args = parser.parse_args()
 
     # Setup logging
@@ -200,7 +253,7 @@ def main():
     paths.renders_dir = args.input_dir  # Override to read from input
 
     # Initialize modules (GPU-only)
-    converter = FormatConverter()
+    converter = FormatConverter.from_dict(pipeline_config.images)
 
     logger.info("Modules initialized (GPU rendering pipeline)")
 
@@ -208,11 +261,11 @@ def main():
     success_count = 0
     failed_samples = []
 
+    # Collect the samples whose .blend files exist
+    samples = []
     for i in range(args.num_samples):
         sample_id = args.start_id + i
 
-        logger.info(f"\nRendering sample {sample_id} ({i+1}/{args.num_samples})")
-
         # Find the corresponding .blend file
         blend_path = paths.get_blend_path(sample_id)
 
@@ -221,19 +274,42 @@ def main():
             failed_samples.append(sample_id)
             continue
 
-        output_path = render_from_blend(
-            sample_id=sample_id,
-            blend_path=blend_path,
-            paths=paths,
-            render_config=render_config,
-            pipeline_config=pipeline_config,
-            converter=converter,
+        samples.append((sample_id, blend_path))
+
+    # Render in batches so BlenderProc starts once per batch, not per sample
+    batch_size = max(1, args.batch_size)
+    batches = [samples[start:start + batch_size] for start in range(0, len(samples), batch_size)]
+    if args.num_gpus > 1:
+        logger.info(f"Rendering on {args.num_gpus} GPUs")
+
+    # Step 5: Render with segmentation (GPU)
+    logger.info("Step 5: Rendering with segmentation (GPU)...")
+    rendered_count = 0
+    for batch, output_paths in _render_batches(batches, paths, render_config, args.num_gpus):
+        rendered_count += len(batch)
+        logger.info(
+            f"\nRendered samples {batch[0][0]}-{batch[-1][0]} "
+            f"({rendered_count}/{len(samples)})"
         )
 
-        if output_path:
-            success_count += 1
-        else:
-            failed_samples.append(sample_id)
+        for sample_id, blend_path in batch:
+            if sample_id not in output_paths:
+                failed_samples.append(sample_id)
+                continue
+
+            logger.info(f"  Rendered sample {sample_id}: {output_paths[sample_id]}")
+            output_path = process_rendered_output(
+                sample_id=sample_id,
+                output_path=output_paths[sample_id],
+                paths=paths,
+                pipeline_config=pipeline_config,
+                converter=converter,
+            )
+
+            if output_path:
+                success_count += 1
+            else:
+                failed_samples.append(sample_id)
 
     # Summary
     logger.info("=" * 60)
@@ -17,6 +17,7 @@ __all__ = [
     "BoardCreator",
     "PCB3DExporter",
     "BlenderImporter",
+    "BlenderWorker",
     "BProcRenderer",
     "RenderConfig",
     "FormatConverter",
@@ -45,6 +46,9 @@ def __getattr__(name):
     elif name == "BlenderImporter":
         from pcb_dataset.importer import BlenderImporter
         return BlenderImporter
+    elif name == "BlenderWorker":
+        from pcb_dataset.blender_worker import BlenderWorker
+        return BlenderWorker
     elif name == "BProcRenderer":
         from pcb_dataset.renderer import BProcRenderer
         return BProcRenderer
@@ -0,0 +1,152 @@
+"""
+Persistent Blender process for running import commands.
+"""
+
+from pathlib import Path
+from typing import Optional
+import json
+import logging
+import queue
+import subprocess
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class BlenderWorker:
+    """
+    Long-lived `blender --background` process serving import commands.
+
+    Blender startup costs several seconds, so instead of spawning one process
+    per sample the worker script (scripts/blender_worker.py) is started once
+    and fed JSON commands over stdin. The process is restarted transparently
+    if it dies (e.g. a segfault while importing a bad board) or hangs past
+    the per-request timeout.
+    """
+
+    RESPONSE_PREFIX = "@@PCB_WORKER@@"
+
+    def __init__(self, worker_script: Optional[Path] = None, timeout: Optional[float] = 1800.0):
+        """
+        Args:
+            worker_script: Path to the Blender-side worker script
+            timeout: Seconds to wait for startup or a response before killing
+                the process (None waits forever)
+        """
+        if worker_script is None:
+            worker_script = Path(__file__).parent.parent.parent / "scripts" / "blender_worker.py"
+        self.worker_script = worker_script
+        self.timeout = timeout
+        self._proc = None
+        self._lines = None
+
+    def _start(self):
+        """Spawn Blender and wait for the worker's ready message."""
+        cmd = ["blender", "--background", "--python", str(self.worker_script)]
+        logger.debug(f"Starting Blender worker: {' '.join(cmd)}")
+
+        self._proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+
+        # A reader thread feeds stdout into a queue so reads can time out
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._pump_stdout, args=(self._proc.stdout, self._lines), daemon=True
+        ).start()
+
+        self._read_response()
+        logger.info("Blender worker started")
+
+    @staticmethod
+    def _pump_stdout(stdout, lines: queue.Queue):
+        """Forward worker output lines to the queue; None marks end of output."""
+        for line in stdout:
+            lines.put(line)
+        lines.put(None)
+
+    def _read_response(self) -> dict:
+        """Read stdout until the next worker response line."""
+        output = []
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                # Hung without exiting - kill it so the next request restarts it
+                self._kill()
+                raise RuntimeError(
+                    f"Blender worker timed out after {self.timeout}s: {''.join(output[-20:])}"
+                )
+            if line is None:
+                break
+            if line.startswith(self.RESPONSE_PREFIX):
+                return json.loads(line[len(self.RESPONSE_PREFIX):])
+            output.append(line)
+            logger.debug(f"Blender worker: {line.rstrip()}")
+
+        # stdout closed without a response - the process died
+        returncode = self._proc.wait()
+        self._proc = None
+        raise RuntimeError(
+            f"Blender worker exited (returncode={returncode}): {''.join(output[-20:])}"
+        )
+
+    def _kill(self):
+        """Kill the Blender process and forget it."""
+        self._proc.kill()
+        self._proc.wait()
+        self._proc = None
+
+    def request(self, command: dict) -> dict:
+        """
+        Send a command to the worker and wait for its response.
+
+        Args:
+            command: JSON-serializable command dict
+
+        Returns:
+            Response dict from the worker
+        """
+        if self._proc is None or self._proc.poll() is not None:
+            self._start()
+
+        try:
+            self._proc.stdin.write(json.dumps(command) + "\n")
+            self._proc.stdin.flush()
+        except BrokenPipeError:
+            self._proc = None
+            raise RuntimeError("Blender worker exited before accepting command")
+
+        response = self._read_response()
+        if response.get("status") != "ok":
+            raise RuntimeError(response.get("error", "unknown worker error"))
+        return response
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Ask the worker to exit, killing it if it does not."""
+        if self._proc is None:
+            return
+
+        try:
+            if self._proc.poll() is None:
+                self._proc.stdin.write(json.dumps({"cmd": "quit"}) + "\n")
+                self._proc.stdin.flush()
+            self._proc.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            self._kill()
+        finally:
+            self._proc = None
@@ -431,6 +431,7 @@ class BoardCreator:
         board_name: str,
         board_width: float = 100.0,
         board_height: float = 100.0,
+        seed: Optional[int] = None,
     ) -> Path:
         """
         Create KiCad board from placements.
@@ -441,6 +442,7 @@ class BoardCreator:
             board_name: Name of the board
             board_width: Board width in mm
             board_height: Board height in mm
+            seed: Seed for the generated routing (unseeded if None)
 
         Returns:
             Path to generated .kicad_pcb file
@@ -479,7 +481,8 @@ class BoardCreator:
         logger.info("Adding routing...")
         routing_stats = add_routing_to_board(
             board, placements, board_width, board_height,
-            params={'add_ground_pour': False}  # Temporarily disable to debug segfault
+            params={'add_ground_pour': False},  # Temporarily disable to debug segfault
+            seed=seed,
         )
         logger.info(f"Routing stats: {routing_stats}")
 
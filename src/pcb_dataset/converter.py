@@ -9,6 +9,13 @@ from PIL import Image
 import logging
 import matplotlib.pyplot as plt
 
+from pcb_dataset.renderer import normalize_depth_u8
+
+try:
+    import pyvips
+except ImportError:
+    pyvips = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,9 +26,63 @@ class FormatConverter:
     Future implementation for Step 5 completion.
     """
 
-    def __init__(self):
-        """Initialize converter."""
-        pass
+    # Image formats extract_images can write (config key images.format)
+    IMAGE_FORMATS = ("png", "tiff")
+
+    def __init__(self, image_format: str = "png", png_compression: int = 6):
+        """
+        Initialize converter.
+
+        Args:
+            image_format: "png", or "tiff" for uncompressed TIFF (no encoding
+                cost, much larger files)
+            png_compression: zlib compression level for PNG output (0-9)
+        """
+        if image_format not in self.IMAGE_FORMATS:
+            raise ValueError(f"Unknown image format '{image_format}', expected one of {self.IMAGE_FORMATS}")
+        self.image_format = image_format
+        self.png_compression = png_compression
+
+    @classmethod
+    def from_dict(cls, config: dict) -> "FormatConverter":
+        """Create a converter from the pipeline config's images section."""
+        return cls(
+            image_format=config.get("format", "png"),
+            png_compression=config.get("png_compression", 6),
+        )
+
+    def _save_image(self, array: np.ndarray, output_dir: Path, name: str) -> Path:
+        """
+        Encode a uint8 image array (H,W or H,W,C) in the configured format.
+
+        Uses libvips when pyvips is installed (much faster encoder than Pillow's
+        single-threaded zlib path), otherwise falls back to Pillow. Installing
+        Pillow-SIMD in place of Pillow speeds up that fallback without code
+        changes.
+
+        Args:
+            array: Image data
+            output_dir: Output directory
+            name: File name without extension
+
+        Returns:
+            Path of the written file
+        """
+        path = output_dir / f"{name}.{'tif' if self.image_format == 'tiff' else 'png'}"
+        if pyvips is not None:
+            array = np.ascontiguousarray(array)
+            height, width = array.shape[:2]
+            bands = array.shape[2] if array.ndim == 3 else 1
+            img = pyvips.Image.new_from_memory(array.data, width, height, bands, "uchar")
+            if self.image_format == "tiff":
+                img.write_to_file(str(path), compression="none", strip=True)
+            else:
+                img.write_to_file(str(path), compression=self.png_compression, strip=True)
+        elif self.image_format == "tiff":
+            Image.fromarray(array).save(path, format="TIFF")
+        else:
+            Image.fromarray(array).save(path, compress_level=self.png_compression)
+        return path
 
     def hdf5_to_coco(self, hdf5_path: Path, output_dir: Path):
         """
@@ -51,7 +112,7 @@ class FormatConverter:
 
     def extract_images(self, hdf5_path: Path, output_dir: Path):
         """
-        Extract RGB, depth, segmentation as separate PNG files.
+        Extract RGB, depth, segmentation as separate image files (PNG or TIFF).
 
         Args:
             hdf5_path: Path to input .hdf5 file
@@ -82,13 +143,15 @@ class FormatConverter:
                 else:
                     rgb = rgb.astype(np.uint8)
 
-                rgb_img = Image.fromarray(rgb)
-                rgb_path = output_dir / f"{stem}_rgb.png"
-                rgb_img.save(rgb_path)
+                rgb_path = self._save_image(rgb, output_dir, f"{stem}_rgb")
                 logger.info(f"✓ Saved RGB: {rgb_path}")
 
-            # Extract and save depth
-            if "depth" in f:
+            # Extract and save depth (prefer the renderer's pre-normalized uint8 copy)
+            if "depth_u8" in f:
+                depth_normalized = np.array(f["depth_u8"])
+                if depth_normalized.ndim == 3:
+                    depth_normalized = depth_normalized[0]
+            elif "depth" in f:
                 depth = np.array(f["depth"])
                 logger.debug(f"Depth shape: {depth.shape}, dtype: {depth.dtype}")
 
@@ -97,10 +160,12 @@ class FormatConverter:
                     depth = depth[0]
 
                 # Normalize depth for visualization
-                depth_normalized = ((depth - depth.min()) / (depth.max() - depth.min()) * 255).astype(np.uint8)
-                depth_img = Image.fromarray(depth_normalized)
-                depth_path = output_dir / f"{stem}_depth.png"
-                depth_img.save(depth_path)
+                depth_normalized = normalize_depth_u8(depth)
+            else:
+                depth_normalized = None
+
+            if depth_normalized is not None:
+                depth_path = self._save_image(depth_normalized, output_dir, f"{stem}_depth")
                 logger.info(f"✓ Saved depth: {depth_path}")
 
             # Extract and save category segmentation (raw)
@@ -113,10 +178,8 @@ class FormatConverter:
                 if seg.ndim == 3:
                     seg = seg[0]
 
-                # Save as indexed PNG (category IDs as pixel values)
-                seg_img = Image.fromarray(seg.astype(np.uint8))
-                seg_path = output_dir / f"{stem}_category_seg.png"
-                seg_img.save(seg_path)
+                # Save as indexed image (category IDs as pixel values)
+                seg_path = self._save_image(seg.astype(np.uint8), output_dir, f"{stem}_category_seg")
                 logger.info(f"✓ Saved category segmentation: {seg_path}")
 
             # Extract and save instance segmentation (raw)
@@ -128,10 +191,9 @@ class FormatConverter:
                 if instance_seg.ndim == 3:
                     instance_seg = instance_seg[0]
 
-                # Save as indexed PNG
-                instance_img = Image.fromarray(instance_seg.astype(np.uint8) if instance_seg.max() < 256 else (instance_seg % 256).astype(np.uint8))
-                instance_path = output_dir / f"{stem}_instance_seg.png"
-                instance_img.save(instance_path)
+                # Save as indexed image
+                instance_u8 = instance_seg.astype(np.uint8) if instance_seg.max() < 256 else (instance_seg % 256).astype(np.uint8)
+                instance_path = self._save_image(instance_u8, output_dir, f"{stem}_instance_seg")
                 logger.info(f"✓ Saved instance segmentation: {instance_path}")
 
         logger.info(f"All images extracted to {output_dir}")
@@ -170,9 +232,7 @@ class FormatConverter:
                     mask = seg == cat_id
                     seg_colored[mask] = (colors_map[idx, :3] * 255).astype(np.uint8)
 
-                seg_viz_img = Image.fromarray(seg_colored)
-                seg_viz_path = output_dir / f"{stem}_category_seg_viz.png"
-                seg_viz_img.save(seg_viz_path)
+                seg_viz_path = self._save_image(seg_colored, output_dir, f"{stem}_category_seg_viz")
                 logger.info(f"✓ Saved colorized category segmentation: {seg_viz_path}")
 
             # Create colorized instance segmentation
@@ -193,9 +253,7 @@ class FormatConverter:
                     color_idx = idx % 20  # Cycle through colors if more than 20 instances
                     instance_colored[mask] = (colors_map[color_idx, :3] * 255).astype(np.uint8)
 
-                instance_viz_img = Image.fromarray(instance_colored)
-                instance_viz_path = output_dir / f"{stem}_instance_seg_viz.png"
-                instance_viz_img.save(instance_viz_path)
+                instance_viz_path = self._save_image(instance_colored, output_dir, f"{stem}_instance_seg_viz")
                 logger.info(f"✓ Saved colorized instance segmentation: {instance_viz_path}")
 
         logger.info(f"Colorized visualizations complete")
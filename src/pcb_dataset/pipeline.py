@@ -3,22 +3,23 @@ Pipeline orchestration - coordinates all modules.
 """
 
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
-import subprocess
 import logging
 
+from pcb_dataset.blender_worker import BlenderWorker
 from pcb_dataset.placement import PerlinPlacer, PlacementConfig
 from pcb_dataset.board import BoardCreator
 from pcb_dataset.exporter import PCB3DExporter
 from pcb_dataset.importer import BlenderImporter
-from pcb_dataset.renderer import BProcRenderer, RenderConfig
+from pcb_dataset.renderer import BProcRenderer, RenderConfig, run_render_process
 from pcb_dataset.converter import FormatConverter
 from pcb_dataset.utils.paths import PathManager
 from pcb_dataset.utils.validation import (
     validate_kicad_file,
     validate_pcb3d_file,
     validate_hdf5_file,
+    validate_output,
 )
 
 logger = logging.getLogger(__name__)
@@ -36,6 +37,8 @@ class PipelineConfig:
     paths: dict
     cleanup: dict
     validation: dict
+    images: dict = field(default_factory=dict)
+    performance: dict = field(default_factory=dict)
 
     @classmethod
     def from_dict(cls, config: dict) -> "PipelineConfig":
@@ -49,6 +52,8 @@ class PipelineConfig:
             paths=config["paths"],
             cleanup=config["cleanup"],
             validation=config["validation"],
+            images=config.get("images", {}),
+            performance=config.get("performance", {}),
         )
 
 
@@ -86,10 +91,23 @@ class Pipeline:
         self.exporter = PCB3DExporter()
         self.importer = BlenderImporter()
         self.renderer = BProcRenderer(render_config)
-        self.converter = FormatConverter()
+        self.converter = FormatConverter.from_dict(pipeline_config.images)
+        self._blender_worker = BlenderWorker(
+            timeout=pipeline_config.performance.get("blender_timeout", 1800)
+        )
 
         logger.info("Pipeline initialized")
 
+    def close(self):
+        """Shut down the persistent Blender worker."""
+        self._blender_worker.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def generate_sample(self, sample_id: int) -> Optional[Path]:
         """
         Generate a single sample through the full pipeline.
@@ -122,11 +140,13 @@ class Pipeline:
                 board_name=f"sample_{sample_id:06d}",
                 board_width=self.placement_config.board_width,
                 board_height=self.placement_config.board_height,
+                seed=seed,
             )
 
-            # Validate board
+            # Validate board (full format checks only with deep_validate)
+            deep_validate = self.pipeline_config.validation.get("deep_validate", False)
             if self.pipeline_config.validation.get("check_file_sizes", True):
-                if not validate_kicad_file(board_path):
+                if not validate_output(board_path, validate_kicad_file, deep=deep_validate):
                     raise RuntimeError(f"Board validation failed: {board_path}")
 
             # Step 3: Export to .pcb3d
@@ -136,7 +156,7 @@ class Pipeline:
 
             # Validate .pcb3d
             if self.pipeline_config.validation.get("check_file_sizes", True):
-                if not validate_pcb3d_file(pcb3d_path):
+                if not validate_output(pcb3d_path, validate_pcb3d_file, deep=deep_validate):
                     raise RuntimeError(f".pcb3d validation failed: {pcb3d_path}")
 
             # Step 4: Import to Blender (run in subprocess)
@@ -151,7 +171,9 @@ class Pipeline:
             # Validate output
             if self.pipeline_config.validation.get("check_file_sizes", True):
                 min_size_mb = self.pipeline_config.validation.get("min_output_size_mb", 1.0)
-                if not validate_hdf5_file(output_path, min_size_mb=min_size_mb):
+                if not validate_output(
+                    output_path, validate_hdf5_file, deep=deep_validate, min_size_mb=min_size_mb
+                ):
                     raise RuntimeError(f"Output validation failed: {output_path}")
 
             # Step 6: Extract PNG images for visualization
@@ -183,36 +205,21 @@ class Pipeline:
 
     def _run_blender_import(self, pcb3d_path: Path, blend_path: Path):
         """
-        Run Blender import in subprocess.
+        Run Blender import in the persistent Blender worker.
 
         Args:
             pcb3d_path: Input .pcb3d file
             blend_path: Output .blend file
         """
-        import_script = Path(__file__).parent.parent.parent / "scripts" / "blender_import_script.py"
-
-        cmd = [
-            "blender",
-            "--background",
-            "--python", str(import_script),
-            "--",
-            str(pcb3d_path),
-            str(blend_path),
-        ]
-
-        logger.debug(f"Running: {' '.join(cmd)}")
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        # Log stdout for debugging
-        if result.stdout:
-            logger.debug(f"Blender import stdout: {result.stdout}")
+        logger.debug(f"Blender worker import: {pcb3d_path} -> {blend_path}")
 
-        if result.returncode != 0:
-            logger.error(f"Blender import failed (returncode={result.returncode})")
-            logger.error(f"stderr: {result.stderr}")
-            logger.error(f"stdout: {result.stdout}")
-            raise RuntimeError(f"Blender import failed: {result.stderr}")
+        try:
+            self._blender_worker.request(
+                {"cmd": "import", "pcb3d": str(pcb3d_path), "blend": str(blend_path)}
+            )
+        except RuntimeError as e:
+            logger.error(f"Blender import failed: {e}")
+            raise RuntimeError(f"Blender import failed: {e}")
 
         logger.info(f"Blender import complete: {blend_path}")
 
@@ -220,6 +227,9 @@ class Pipeline:
         """
         Run BlenderProc rendering in subprocess.
 
+        The HDF5 file is the one the render script reports (see
+        run_render_process), not the newest file in the output directory.
+
         Args:
             blend_path: Input .blend file
             sample_id: Sample ID
@@ -227,37 +237,15 @@ class Pipeline:
         Returns:
             Path to generated HDF5 file
         """
-        render_script = Path(__file__).parent.parent.parent / "scripts" / "blenderproc_render_script.py"
-        config_dir = Path(__file__).parent.parent.parent / "config"
-
-        cmd = [
-            "blenderproc", "run",
-            str(render_script),
-            str(blend_path),
-            str(self.paths.output_dir),
-            "--config-dir", str(config_dir),
-        ]
+        rendered = run_render_process([blend_path], self.paths.output_dir)
+        hdf5_path = rendered[str(blend_path)]
+        if hdf5_path is None:
+            raise RuntimeError(f"BlenderProc render failed for {blend_path}")
 
-        logger.debug(f"Running: {' '.join(cmd)}")
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            logger.error(f"BlenderProc render failed: {result.stderr}")
-            raise RuntimeError(f"BlenderProc render failed: {result.stderr}")
-
-        # Find the generated output file
+        # Rename to expected output path
         output_path = self.paths.get_output_path(sample_id, resolution=self.render_config.resolution)
-
-        # BlenderProc creates numbered files, find the latest HDF5 in output dir
-        hdf5_files = sorted(self.paths.output_dir.glob("*.hdf5"), key=lambda p: p.stat().st_mtime)
-        if hdf5_files:
-            latest_hdf5 = hdf5_files[-1]
-            # Rename to expected output path
-            latest_hdf5.rename(output_path)
-            logger.info(f"BlenderProc render complete: {output_path}")
-        else:
-            raise RuntimeError("No HDF5 output file generated")
+        hdf5_path.rename(output_path)
+        logger.info(f"BlenderProc render complete: {output_path}")
 
         return output_path
 
@@ -7,12 +7,21 @@ Production wrapper around POC placement logic from:
 Maintains production's class structure but uses exact POC algorithm.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
+from types import MappingProxyType
+from typing import Iterable, List, Optional, Dict, Union
 import numpy as np
-from noise import pnoise2
-import random
+import bisect
+import functools
 import logging
+import math
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 logger = logging.getLogger(__name__)
 
@@ -53,36 +62,46 @@ class PlacementConfig:
     # Grid sizes for adaptive grid
     grid_sizes: List[float]
 
+    # Stop a placement pass after this many consecutive failures (None = never)
+    max_consecutive_failures: Optional[int] = None
+
     @classmethod
     def from_dict(cls, config: dict) -> "PlacementConfig":
         """Create config from dictionary (loaded from YAML)."""
+        perlin = config["perlin"]
+        components = config["components"]
+        large = components.get("large", {})
+        medium = components.get("medium", {})
+        small = components.get("small", {})
+
         # Map production config format to POC parameters
         return cls(
-            scale=config["perlin"]["scale"],
-            octaves=config["perlin"]["octaves"],
-            persistence=config["perlin"]["persistence"],
-            lacunarity=config["perlin"]["lacunarity"],
-            seed=config["perlin"]["seed"],
+            scale=perlin["scale"],
+            octaves=perlin["octaves"],
+            persistence=perlin["persistence"],
+            lacunarity=perlin["lacunarity"],
+            seed=perlin["seed"],
             vignette_enabled=config["vignette"]["enabled"],
             vignette_strength=config["vignette"]["strength"],
             # Use POC parameter names
-            large_count=config["components"].get("large", {}).get("count", 1),
-            medium_count=config["components"].get("medium", {}).get("count", 20),
-            small_med_count=config["components"].get("small", {}).get("count", 60) // 2,
-            small_count=config["components"].get("small", {}).get("count", 60) // 2,
-            connector_count=config["components"].get("connectors", {}).get("count", 10),
-            testpoint_count=config["components"].get("testpoints", {}).get("count", 15),
-            large_spacing=config["components"].get("large", {}).get("spacing", 10.0),
-            medium_spacing=config["components"].get("medium", {}).get("spacing", 5.0),
-            small_med_spacing=config["components"].get("small", {}).get("spacing", 3.0),
-            small_spacing=config["components"].get("small", {}).get("spacing", 2.5),
+            large_count=large.get("count", 1),
+            medium_count=medium.get("count", 20),
+            small_med_count=small.get("count", 60) // 2,
+            small_count=small.get("count", 60) // 2,
+            connector_count=components.get("connectors", {}).get("count", 10),
+            testpoint_count=components.get("testpoints", {}).get("count", 15),
+            large_spacing=large.get("spacing", 10.0),
+            medium_spacing=medium.get("spacing", 5.0),
+            small_med_spacing=small.get("spacing", 3.0),
+            small_spacing=small.get("spacing", 2.5),
             board_width=config["board"]["width"],
             board_height=config["board"]["height"],
             grid_sizes=config.get("grid_sizes", [24.4, 14.6, 13.5, 3.6, 1.5]),
+            max_consecutive_failures=components.get("max_consecutive_failures"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentPlacement:
     """Single component placement (production interface)."""
 
@@ -93,6 +112,11 @@ class ComponentPlacement:
     component_type: str  # Actual footprint name from library
 
 
+# Placements of one board as parallel arrays (see PerlinPlacer.generate_placements_array);
+# size_category and component_type index SIZE_CATEGORIES and FOOTPRINT_NAMES
+PlacementArrays = namedtuple('PlacementArrays', 'x y rotation size_category component_type')
+
+
 # ============================================================================
 # POC Component class - exact copy from POC
 # ============================================================================
@@ -103,7 +127,14 @@ class Component:
 
     Exact copy from POC: component_placement.py
     """
+    __slots__ = (
+        '_size', '_location', '_rotation', '_w', '_h', '_bounds',
+        'num_pins', 'threshold', 'comp_type', 'footprint_name',
+    )
+
     def __init__(self, size, num_pins, location, threshold, rotation=0, comp_type='generic'):
+        self._bounds = None  # Cached get_bounds() result
+        self._rotation = rotation
         self.size = size
         self.num_pins = num_pins
         self.location = location
@@ -112,35 +143,63 @@ class Component:
         self.comp_type = comp_type
         self.footprint_name = None  # Set during placement
 
+    # Geometry attributes invalidate the cached bounds when reassigned
+    @property
+    def size(self):
+        return self._size
+
+    @size.setter
+    def size(self, value):
+        self._size = value
+        self._update_extent()
+
+    @property
+    def location(self):
+        return self._location
+
+    @location.setter
+    def location(self, value):
+        self._location = value
+        self._bounds = None
+
+    @property
+    def rotation(self):
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value):
+        self._rotation = value
+        self._update_extent()
+
+    def _update_extent(self):
+        """Precompute the rotated footprint extent (w, h) used by get_bounds."""
+        width, height = self._size
+        if self._rotation == 90 or self._rotation == 270:
+            width, height = height, width
+        self._w = width
+        self._h = height
+        self._bounds = None
+
     def get_bounds(self):
         """Get the bounding box of the component (accounting for rotation)."""
-        x, y = self.location
-        width, height = self.size
+        if self._bounds is not None:
+            return self._bounds
 
-        if self.rotation in [90, 270]:
-            width, height = height, width
-
-        return (
-            x - width/2,
-            y - height/2,
-            x + width/2,
-            y + height/2
-        )
+        x, y = self._location
+        half_w = self._w / 2
+        half_h = self._h / 2
+        self._bounds = (x - half_w, y - half_h, x + half_w, y + half_h)
+        return self._bounds
 
     def overlaps_with(self, other, min_clearance=1.0):
         """Check if this component overlaps with another component."""
-        x1_min, y1_min, x1_max, y1_max = self.get_bounds()
-        x2_min, y2_min, x2_max, y2_max = other.get_bounds()
-
-        x1_min -= min_clearance
-        y1_min -= min_clearance
-        x1_max += min_clearance
-        y1_max += min_clearance
-
-        no_overlap = (x1_max <= x2_min or x2_max <= x1_min or
-                     y1_max <= y2_min or y2_max <= y1_min)
+        x1_min, y1_min, x1_max, y1_max = self._bounds or self.get_bounds()
+        x2_min, y2_min, x2_max, y2_max = other._bounds or other.get_bounds()
 
-        return not no_overlap
+        # Clearance-expanded intervals intersect on both axes - the same four
+        # strict comparisons as the PlacementIndex kernels, no negation
+        return (x2_min < x1_max + min_clearance and x1_min - min_clearance < x2_max and
+                y2_min < y1_max + min_clearance and y1_min - min_clearance < y2_max)
 
     def can_place(self, noise_map, placed_components=None):
         """Check if the component can be placed at its location."""
@@ -161,225 +220,222 @@ class Component:
         return True
 
 
+def _window_overlaps_loops(bounds, lo, hi, qxmax, qymax, neg_qxmin, neg_qymin):
+    """
+    Scalar overlap scan over rows lo:hi of a PlacementIndex bounds block.
+
+    Rows are (xmin, ymin, -xmax, -ymax), so a hit is four strict less-than
+    tests against the negated query box; returns on the first hit.
+    """
+    for i in range(lo, hi):
+        if (bounds[i, 0] < qxmax and bounds[i, 1] < qymax and
+                bounds[i, 2] < neg_qxmin and bounds[i, 3] < neg_qymin):
+            return True
+    return False
+
+
+def _batch_overlaps_loops(bounds, lo, hi, candidates, min_clearance, hits):
+    """
+    _window_overlaps_loops for every (xmin, ymin, xmax, ymax) candidate row;
+    writes one flag per candidate into `hits`.
+    """
+    for k in range(candidates.shape[0]):
+        qxmax = candidates[k, 2] + min_clearance
+        qymax = candidates[k, 3] + min_clearance
+        neg_qxmin = -(candidates[k, 0] - min_clearance)
+        neg_qymin = -(candidates[k, 1] - min_clearance)
+        for i in range(lo, hi):
+            if (bounds[i, 0] < qxmax and bounds[i, 1] < qymax and
+                    bounds[i, 2] < neg_qxmin and bounds[i, 3] < neg_qymin):
+                hits[k] = True
+                break
+
+
+# Compiled overlap scans when Numba is installed; they replace the Python loop
+# and the broadcast comparisons in PlacementIndex
+_window_overlaps_jit = njit(cache=True)(_window_overlaps_loops) if njit else None
+_batch_overlaps_jit = njit(cache=True)(_batch_overlaps_loops) if njit else None
+
+
+class PlacementIndex:
+    """
+    Sort-and-sweep index over the bounds of placed components.
+
+    Entries are kept sorted by xmin, so a query only has to look at the
+    x-window that can intersect it (bounded by the widest box inserted so
+    far) instead of every placed component. Bounds are also stored as a
+    NumPy block of (xmin, ymin, -xmax, -ymax) rows, which turns the overlap
+    test for a whole window into a single broadcast comparison.
+    """
+
+    # Windows smaller than this are tested in plain Python; NumPy call
+    # overhead dominates for a handful of candidates
+    VECTORIZE_MIN = 64
+
+    def __init__(self, capacity=256):
+        self._xmins = []
+        self._components = []
+        self._bounds = np.empty((capacity, 4))
+        self._max_width = 0.0
+
+    def __len__(self):
+        return len(self._components)
+
+    def insert(self, component):
+        """Add a placed component to the index."""
+        xmin, ymin, xmax, ymax = component.get_bounds()
+        count = len(self._components)
+
+        if count == len(self._bounds):
+            grown = np.empty((2 * count, 4))
+            grown[:count] = self._bounds
+            self._bounds = grown
+
+        i = bisect.bisect_right(self._xmins, xmin)
+        self._bounds[i + 1:count + 1] = self._bounds[i:count]
+        self._bounds[i] = (xmin, ymin, -xmax, -ymax)
+        self._xmins.insert(i, xmin)
+        self._components.insert(i, component)
+        self._max_width = max(self._max_width, xmax - xmin)
+
+    def _window(self, qxmin, qxmax):
+        """Index range of entries whose x-extent may intersect [qxmin, qxmax]."""
+        lo = bisect.bisect_left(self._xmins, qxmin - self._max_width)
+        hi = bisect.bisect_left(self._xmins, qxmax)
+        return lo, hi
+
+    def intersection(self, bounds):
+        """Return placed components whose x-extent may intersect bounds."""
+        lo, hi = self._window(bounds[0], bounds[2])
+        return self._components[lo:hi]
+
+    def overlaps(self, component, min_clearance=1.0):
+        """
+        Check if component overlaps any placed component.
+
+        Same test as Component.overlaps_with (strict inequalities on the
+        clearance-expanded candidate box).
+        """
+        xmin, ymin, xmax, ymax = component.get_bounds()
+        qxmin = xmin - min_clearance
+        qxmax = xmax + min_clearance
+        lo, hi = self._window(qxmin, qxmax)
+        qymin = ymin - min_clearance
+        qymax = ymax + min_clearance
+
+        if _window_overlaps_jit is not None:
+            return _window_overlaps_jit(self._bounds, lo, hi, qxmax, qymax, -qxmin, -qymin)
+
+        if hi - lo < self.VECTORIZE_MIN:
+            # Inline Component.overlaps_with over the window's bounds rows
+            neg_qxmin = -qxmin
+            neg_qymin = -qymin
+            for pxmin, pymin, neg_pxmax, neg_pymax in self._bounds[lo:hi].tolist():
+                if pxmin < qxmax and pymin < qymax and neg_pxmax < neg_qxmin and neg_pymax < neg_qymin:
+                    return True
+            return False
+
+        # placed.xmin < qxmax, placed.ymin < qymax, qxmin < placed.xmax, qymin < placed.ymax
+        query = (qxmax, qymax, -qxmin, -qymin)
+        return bool((self._bounds[lo:hi] < query).all(axis=1).any())
+
+    def overlaps_batch(self, bounds, min_clearance=1.0):
+        """
+        Vectorized overlaps() for a batch of candidate boxes.
+
+        Args:
+            bounds: (K, 4) array of candidate (xmin, ymin, xmax, ymax) rows
+            min_clearance: Clearance added around every candidate
+
+        Returns:
+            (K,) boolean array, True where the candidate overlaps a placed component
+        """
+        hits = np.zeros(len(bounds), dtype=bool)
+        if not self._components or not len(bounds):
+            return hits
+
+        if _batch_overlaps_jit is not None:
+            lo, hi = self._window(bounds[:, 0].min() - min_clearance, bounds[:, 2].max() + min_clearance)
+            _batch_overlaps_jit(self._bounds, lo, hi, bounds, min_clearance, hits)
+            return hits
+
+        query = np.column_stack((
+            bounds[:, 2] + min_clearance,
+            bounds[:, 3] + min_clearance,
+            -(bounds[:, 0] - min_clearance),
+            -(bounds[:, 1] - min_clearance),
+        ))
+        lo, hi = self._window(-query[:, 2].max(), query[:, 0].max())
+        if lo < hi:
+            hits = (self._bounds[lo:hi] < query[:, np.newaxis, :]).all(axis=2).any(axis=1)
+        return hits
+
+
 # ============================================================================
 # POC ExpandedComponentLibrary - subset of most common components
 # ============================================================================
 
+# Immutable library entry; get_component() turns it into a dict on request
+ComponentSpec = namedtuple('ComponentSpec', 'footprint value reference_prefix size num_pins')
+
+
 class ExpandedComponentLibrary:
     """
     Component library from POC.
     Subset of most commonly used components.
     """
 
+    # Static library data, shared read-only by all instances
+    components = MappingProxyType({
+        # Small SMD passives
+        'resistor_0402': ComponentSpec('Resistor_SMD:R_0402_1005Metric', '10k', 'R', (1.0, 0.5), 2),
+        'resistor_0603': ComponentSpec('Resistor_SMD:R_0603_1608Metric', '10k', 'R', (1.6, 0.8), 2),
+        'resistor_0805': ComponentSpec('Resistor_SMD:R_0805_2012Metric', '10k', 'R', (2.0, 1.25), 2),
+        'resistor_1206': ComponentSpec('Resistor_SMD:R_1206_3216Metric', '10k', 'R', (3.2, 1.6), 2),
+        'capacitor_0402': ComponentSpec('Capacitor_SMD:C_0402_1005Metric', '100nF', 'C', (1.0, 0.5), 2),
+        'capacitor_0603': ComponentSpec('Capacitor_SMD:C_0603_1608Metric', '100nF', 'C', (1.6, 0.8), 2),
+        'capacitor_0805': ComponentSpec('Capacitor_SMD:C_0805_2012Metric', '100nF', 'C', (2.0, 1.25), 2),
+        'capacitor_1206': ComponentSpec('Capacitor_SMD:C_1206_3216Metric', '100nF', 'C', (3.2, 1.6), 2),
+        'inductor_0805': ComponentSpec('Inductor_SMD:L_0805_2012Metric', '10uH', 'L', (2.0, 1.25), 2),
+        'inductor_1206': ComponentSpec('Inductor_SMD:L_1206_3216Metric', '10uH', 'L', (3.2, 1.6), 2),
+        # Medium ICs
+        'soic8': ComponentSpec('Package_SO:SOIC-8_3.9x4.9mm_P1.27mm', 'IC', 'U', (3.9, 4.9), 8),
+        'soic14': ComponentSpec('Package_SO:SOIC-14_3.9x8.7mm_P1.27mm', 'IC', 'U', (3.9, 8.7), 14),
+        'soic16': ComponentSpec('Package_SO:SOIC-16_3.9x9.9mm_P1.27mm', 'IC', 'U', (3.9, 9.9), 16),
+        'tssop14': ComponentSpec('Package_SO:TSSOP-14_4.4x5mm_P0.65mm', 'IC', 'U', (4.4, 5.0), 14),
+        'tssop16': ComponentSpec('Package_SO:TSSOP-16_4.4x5mm_P0.65mm', 'IC', 'U', (4.4, 5.0), 16),
+        'tssop20': ComponentSpec('Package_SO:TSSOP-20_4.4x6.5mm_P0.65mm', 'IC', 'U', (4.4, 6.5), 20),
+        'qfp32': ComponentSpec('Package_QFP:LQFP-32_7x7mm_P0.8mm', 'IC', 'U', (7.0, 7.0), 32),
+        'qfp44': ComponentSpec('Package_QFP:LQFP-44_10x10mm_P0.8mm', 'IC', 'U', (10.0, 10.0), 44),
+        'qfp48': ComponentSpec('Package_QFP:LQFP-48_7x7mm_P0.5mm', 'IC', 'U', (7.0, 7.0), 48),
+        'qfp64': ComponentSpec('Package_QFP:LQFP-64_10x10mm_P0.5mm', 'IC', 'U', (10.0, 10.0), 64),
+        # Large ICs
+        'qfp80': ComponentSpec('Package_QFP:LQFP-80_12x12mm_P0.5mm', 'IC', 'U', (12.0, 12.0), 80),
+        'qfp100': ComponentSpec('Package_QFP:LQFP-100_14x14mm_P0.5mm', 'IC', 'U', (14.0, 14.0), 100),
+        'qfp144': ComponentSpec('Package_QFP:LQFP-144_20x20mm_P0.5mm', 'IC', 'U', (20.0, 20.0), 144),
+        'bga64': ComponentSpec('Package_BGA:BGA-64_9.0x9.0mm_Layout10x10_P0.8mm', 'IC', 'U', (9.0, 9.0), 64),
+        'bga100': ComponentSpec('Package_BGA:BGA-100_11.0x11.0mm_Layout10x10_P1.0mm_Ball0.5mm_Pad0.4mm_NSMD', 'IC', 'U', (11.0, 11.0), 100),
+        'bga144': ComponentSpec('Package_BGA:BGA-144_13.0x13.0mm_Layout12x12_P1.0mm', 'IC', 'U', (13.0, 13.0), 144),
+        'bga256': ComponentSpec('Package_BGA:BGA-256_17.0x17.0mm_Layout16x16_P1.0mm_Ball0.5mm_Pad0.4mm_NSMD', 'IC', 'U', (17.0, 17.0), 256),
+        # Connectors
+        'connector_2pin': ComponentSpec('Connector_PinHeader_2.54mm:PinHeader_1x02_P2.54mm_Vertical', 'CONN', 'J', (2.54, 5.08), 2),
+        'connector_4pin': ComponentSpec('Connector_PinHeader_2.54mm:PinHeader_1x04_P2.54mm_Vertical', 'CONN', 'J', (2.54, 10.16), 4),
+        'connector_6pin': ComponentSpec('Connector_PinHeader_2.54mm:PinHeader_1x06_P2.54mm_Vertical', 'CONN', 'J', (2.54, 15.24), 6),
+        'connector_8pin': ComponentSpec('Connector_PinHeader_2.54mm:PinHeader_1x08_P2.54mm_Vertical', 'CONN', 'J', (2.54, 20.32), 8),
+        'connector_10pin': ComponentSpec('Connector_PinHeader_2.54mm:PinHeader_1x10_P2.54mm_Vertical', 'CONN', 'J', (2.54, 25.4), 10),
+        'connector_2x5': ComponentSpec('Connector_PinHeader_2.54mm:PinHeader_2x05_P2.54mm_Vertical', 'CONN', 'J', (5.08, 12.7), 10),
+        'connector_2x8': ComponentSpec('Connector_PinHeader_2.54mm:PinHeader_2x08_P2.54mm_Vertical', 'CONN', 'J', (5.08, 20.32), 16),
+        # Diodes and LEDs
+        'diode_sod123': ComponentSpec('Diode_SMD:D_SOD-123', '1N4148', 'D', (2.7, 1.6), 2),
+        'led_0603': ComponentSpec('LED_SMD:LED_0603_1608Metric', 'LED', 'D', (1.6, 0.8), 2),
+        'led_0805': ComponentSpec('LED_SMD:LED_0805_2012Metric', 'LED', 'D', (2.0, 1.25), 2),
+        # Test Points
+        'testpoint_1mm': ComponentSpec('TestPoint:TestPoint_Pad_D1.0mm', 'TP', 'TP', (1.0, 1.0), 1),
+        'testpoint_1_5mm': ComponentSpec('TestPoint:TestPoint_Pad_D1.5mm', 'TP', 'TP', (1.5, 1.5), 1),
+        'testpoint_2mm': ComponentSpec('TestPoint:TestPoint_Pad_D2.0mm', 'TP', 'TP', (2.0, 2.0), 1),
+    })
+
     def __init__(self):
-        self.components = {
-            # Small SMD passives
-            'resistor_0402': {
-                'footprint': 'Resistor_SMD:R_0402_1005Metric',
-                'value': '10k', 'reference_prefix': 'R',
-                'size': (1.0, 0.5), 'num_pins': 2
-            },
-            'resistor_0603': {
-                'footprint': 'Resistor_SMD:R_0603_1608Metric',
-                'value': '10k', 'reference_prefix': 'R',
-                'size': (1.6, 0.8), 'num_pins': 2
-            },
-            'resistor_0805': {
-                'footprint': 'Resistor_SMD:R_0805_2012Metric',
-                'value': '10k', 'reference_prefix': 'R',
-                'size': (2.0, 1.25), 'num_pins': 2
-            },
-            'resistor_1206': {
-                'footprint': 'Resistor_SMD:R_1206_3216Metric',
-                'value': '10k', 'reference_prefix': 'R',
-                'size': (3.2, 1.6), 'num_pins': 2
-            },
-            'capacitor_0402': {
-                'footprint': 'Capacitor_SMD:C_0402_1005Metric',
-                'value': '100nF', 'reference_prefix': 'C',
-                'size': (1.0, 0.5), 'num_pins': 2
-            },
-            'capacitor_0603': {
-                'footprint': 'Capacitor_SMD:C_0603_1608Metric',
-                'value': '100nF', 'reference_prefix': 'C',
-                'size': (1.6, 0.8), 'num_pins': 2
-            },
-            'capacitor_0805': {
-                'footprint': 'Capacitor_SMD:C_0805_2012Metric',
-                'value': '100nF', 'reference_prefix': 'C',
-                'size': (2.0, 1.25), 'num_pins': 2
-            },
-            'capacitor_1206': {
-                'footprint': 'Capacitor_SMD:C_1206_3216Metric',
-                'value': '100nF', 'reference_prefix': 'C',
-                'size': (3.2, 1.6), 'num_pins': 2
-            },
-            'inductor_0805': {
-                'footprint': 'Inductor_SMD:L_0805_2012Metric',
-                'value': '10uH', 'reference_prefix': 'L',
-                'size': (2.0, 1.25), 'num_pins': 2
-            },
-            'inductor_1206': {
-                'footprint': 'Inductor_SMD:L_1206_3216Metric',
-                'value': '10uH', 'reference_prefix': 'L',
-                'size': (3.2, 1.6), 'num_pins': 2
-            },
-            # Medium ICs
-            'soic8': {
-                'footprint': 'Package_SO:SOIC-8_3.9x4.9mm_P1.27mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (3.9, 4.9), 'num_pins': 8
-            },
-            'soic14': {
-                'footprint': 'Package_SO:SOIC-14_3.9x8.7mm_P1.27mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (3.9, 8.7), 'num_pins': 14
-            },
-            'soic16': {
-                'footprint': 'Package_SO:SOIC-16_3.9x9.9mm_P1.27mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (3.9, 9.9), 'num_pins': 16
-            },
-            'tssop14': {
-                'footprint': 'Package_SO:TSSOP-14_4.4x5mm_P0.65mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (4.4, 5.0), 'num_pins': 14
-            },
-            'tssop16': {
-                'footprint': 'Package_SO:TSSOP-16_4.4x5mm_P0.65mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (4.4, 5.0), 'num_pins': 16
-            },
-            'tssop20': {
-                'footprint': 'Package_SO:TSSOP-20_4.4x6.5mm_P0.65mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (4.4, 6.5), 'num_pins': 20
-            },
-            'qfp32': {
-                'footprint': 'Package_QFP:LQFP-32_7x7mm_P0.8mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (7.0, 7.0), 'num_pins': 32
-            },
-            'qfp44': {
-                'footprint': 'Package_QFP:LQFP-44_10x10mm_P0.8mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (10.0, 10.0), 'num_pins': 44
-            },
-            'qfp48': {
-                'footprint': 'Package_QFP:LQFP-48_7x7mm_P0.5mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (7.0, 7.0), 'num_pins': 48
-            },
-            'qfp64': {
-                'footprint': 'Package_QFP:LQFP-64_10x10mm_P0.5mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (10.0, 10.0), 'num_pins': 64
-            },
-            # Large ICs
-            'qfp80': {
-                'footprint': 'Package_QFP:LQFP-80_12x12mm_P0.5mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (12.0, 12.0), 'num_pins': 80
-            },
-            'qfp100': {
-                'footprint': 'Package_QFP:LQFP-100_14x14mm_P0.5mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (14.0, 14.0), 'num_pins': 100
-            },
-            'qfp144': {
-                'footprint': 'Package_QFP:LQFP-144_20x20mm_P0.5mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (20.0, 20.0), 'num_pins': 144
-            },
-            'bga64': {
-                'footprint': 'Package_BGA:BGA-64_9.0x9.0mm_Layout10x10_P0.8mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (9.0, 9.0), 'num_pins': 64
-            },
-            'bga100': {
-                'footprint': 'Package_BGA:BGA-100_11.0x11.0mm_Layout10x10_P1.0mm_Ball0.5mm_Pad0.4mm_NSMD',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (11.0, 11.0), 'num_pins': 100
-            },
-            'bga144': {
-                'footprint': 'Package_BGA:BGA-144_13.0x13.0mm_Layout12x12_P1.0mm',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (13.0, 13.0), 'num_pins': 144
-            },
-            'bga256': {
-                'footprint': 'Package_BGA:BGA-256_17.0x17.0mm_Layout16x16_P1.0mm_Ball0.5mm_Pad0.4mm_NSMD',
-                'value': 'IC', 'reference_prefix': 'U',
-                'size': (17.0, 17.0), 'num_pins': 256
-            },
-            # Connectors
-            'connector_2pin': {
-                'footprint': 'Connector_PinHeader_2.54mm:PinHeader_1x02_P2.54mm_Vertical',
-                'value': 'CONN', 'reference_prefix': 'J',
-                'size': (2.54, 5.08), 'num_pins': 2
-            },
-            'connector_4pin': {
-                'footprint': 'Connector_PinHeader_2.54mm:PinHeader_1x04_P2.54mm_Vertical',
-                'value': 'CONN', 'reference_prefix': 'J',
-                'size': (2.54, 10.16), 'num_pins': 4
-            },
-            'connector_6pin': {
-                'footprint': 'Connector_PinHeader_2.54mm:PinHeader_1x06_P2.54mm_Vertical',
-                'value': 'CONN', 'reference_prefix': 'J',
-                'size': (2.54, 15.24), 'num_pins': 6
-            },
-            'connector_8pin': {
-                'footprint': 'Connector_PinHeader_2.54mm:PinHeader_1x08_P2.54mm_Vertical',
-                'value': 'CONN', 'reference_prefix': 'J',
-                'size': (2.54, 20.32), 'num_pins': 8
-            },
-            'connector_10pin': {
-                'footprint': 'Connector_PinHeader_2.54mm:PinHeader_1x10_P2.54mm_Vertical',
-                'value': 'CONN', 'reference_prefix': 'J',
-                'size': (2.54, 25.4), 'num_pins': 10
-            },
-            'connector_2x5': {
-                'footprint': 'Connector_PinHeader_2.54mm:PinHeader_2x05_P2.54mm_Vertical',
-                'value': 'CONN', 'reference_prefix': 'J',
-                'size': (5.08, 12.7), 'num_pins': 10
-            },
-            'connector_2x8': {
-                'footprint': 'Connector_PinHeader_2.54mm:PinHeader_2x08_P2.54mm_Vertical',
-                'value': 'CONN', 'reference_prefix': 'J',
-                'size': (5.08, 20.32), 'num_pins': 16
-            },
-            # Diodes and LEDs
-            'diode_sod123': {
-                'footprint': 'Diode_SMD:D_SOD-123',
-                'value': '1N4148', 'reference_prefix': 'D',
-                'size': (2.7, 1.6), 'num_pins': 2
-            },
-            'led_0603': {
-                'footprint': 'LED_SMD:LED_0603_1608Metric',
-                'value': 'LED', 'reference_prefix': 'D',
-                'size': (1.6, 0.8), 'num_pins': 2
-            },
-            'led_0805': {
-                'footprint': 'LED_SMD:LED_0805_2012Metric',
-                'value': 'LED', 'reference_prefix': 'D',
-                'size': (2.0, 1.25), 'num_pins': 2
-            },
-            # Test Points
-            'testpoint_1mm': {
-                'footprint': 'TestPoint:TestPoint_Pad_D1.0mm',
-                'value': 'TP', 'reference_prefix': 'TP',
-                'size': (1.0, 1.0), 'num_pins': 1
-            },
-            'testpoint_1_5mm': {
-                'footprint': 'TestPoint:TestPoint_Pad_D1.5mm',
-                'value': 'TP', 'reference_prefix': 'TP',
-                'size': (1.5, 1.5), 'num_pins': 1
-            },
-            'testpoint_2mm': {
-                'footprint': 'TestPoint:TestPoint_Pad_D2.0mm',
-                'value': 'TP', 'reference_prefix': 'TP',
-                'size': (2.0, 2.0), 'num_pins': 1
-            },
-        }
         self._component_counters = {}
 
     def get_component(self, component_type: str) -> dict:
@@ -387,7 +443,7 @@ class ExpandedComponentLibrary:
         if component_type not in self.components:
             raise KeyError(f"Component type '{component_type}' not found in library")
 
-        component = self.components[component_type].copy()
+        component = self.components[component_type]._asdict()
         prefix = component['reference_prefix']
 
         if prefix not in self._component_counters:
@@ -397,6 +453,161 @@ class ExpandedComponentLibrary:
         self._component_counters[prefix] += 1
 
         return component
+
+
+# ============================================================================
+# Perlin noise - vectorized gradient noise with an optional Numba kernel
+# ============================================================================
+
+def _fade(t):
+    """Perlin quintic fade curve 6t^5 - 15t^4 + 10t^3."""
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+
+# Size of the Perlin permutation/gradient tables; must be a power of two so
+# lattice coordinates wrap with a bitwise AND instead of a modulo
+_PERM_SIZE = 256
+_PERM_MASK = _PERM_SIZE - 1
+
+
+def _perlin_octave_loops(noise, fx, fy, ry0, ry1, cx0, cx1, perm, grad_x, grad_y, amplitude):
+    """
+    Accumulate one Perlin octave into `noise` with explicit per-pixel loops.
+
+    Same math as the NumPy path in _perlin_grid, written as scalar
+    multiply-adds so Numba can fuse it into one pass without temporaries.
+    """
+    height, width = noise.shape
+    for i in range(height):
+        ty = fy[i]
+        v = ty * ty * ty * (ty * (ty * 6 - 15) + 10)
+        y0 = ry0[i]
+        y1 = ry1[i]
+        for j in range(width):
+            tx = fx[j]
+            u = tx * tx * tx * (tx * (tx * 6 - 15) + 10)
+            g00 = perm[(cx0[j] + y0) & 0xFF]
+            g10 = perm[(cx1[j] + y0) & 0xFF]
+            g01 = perm[(cx0[j] + y1) & 0xFF]
+            g11 = perm[(cx1[j] + y1) & 0xFF]
+            n00 = grad_x[g00] * tx + grad_y[g00] * ty
+            n10 = grad_x[g10] * (tx - 1) + grad_y[g10] * ty
+            n01 = grad_x[g01] * tx + grad_y[g01] * (ty - 1)
+            n11 = grad_x[g11] * (tx - 1) + grad_y[g11] * (ty - 1)
+            n0 = n00 + u * (n10 - n00)
+            n1 = n01 + u * (n11 - n01)
+            noise[i, j] += amplitude * (n0 + v * (n1 - n0))
+
+
+# JIT-compiled octave kernel when Numba is installed, else the NumPy path is used
+_perlin_octave_jit = njit(cache=True)(_perlin_octave_loops) if njit else None
+
+
+def _perlin_grid(shape, scale, octaves, persistence, lacunarity, seed=None):
+    """
+    Vectorized multi-octave 2D Perlin noise sampled at every pixel.
+
+    Port of perlin-numpy's generate_perlin_noise_2d, generalized to sample at
+    (x / scale, y / scale) lattice coordinates so the map size does not have
+    to be a multiple of the noise resolution. Lattice gradients are looked up
+    through a classic 256-entry permutation table, so the cost per octave does
+    not depend on how many lattice cells the map spans.
+
+    Args:
+        shape: (height, width) of the output map
+        scale: Pixels per lattice cell at the first octave
+        octaves: Number of noise layers to combine
+        persistence: Amplitude multiplier per octave
+        lacunarity: Frequency multiplier per octave
+        seed: Random seed for the permutation and gradient tables
+
+    Returns:
+        2D numpy array of raw (unnormalized) noise values
+    """
+    rng = np.random.default_rng(seed)
+    perm = rng.permutation(_PERM_SIZE).astype(np.uint8)
+    angles = 2 * np.pi * rng.random(_PERM_SIZE)
+    grad_x = np.cos(angles)
+    grad_y = np.sin(angles)
+
+    height, width = shape
+    noise = np.zeros(shape)
+
+    frequency = 1.0 / scale
+    amplitude = 1.0
+    for _ in range(octaves):
+        # Lattice cell and fractional offset of every row/column
+        xs = np.arange(width) * frequency
+        ys = np.arange(height) * frequency
+        x0 = np.floor(xs).astype(np.int64)
+        y0 = np.floor(ys).astype(np.int64)
+        fx = xs - x0
+        fy = ys - y0
+
+        # First permutation lookup depends only on the column, wrapped row
+        # coordinates only on the row - hash those once per line
+        cx0 = perm[x0 & _PERM_MASK].astype(np.int64)
+        cx1 = perm[(x0 + 1) & _PERM_MASK].astype(np.int64)
+        ry0 = y0 & _PERM_MASK
+        ry1 = (y0 + 1) & _PERM_MASK
+
+        if _perlin_octave_jit is not None:
+            _perlin_octave_jit(
+                noise, fx, fy, ry0, ry1, cx0, cx1, perm, grad_x, grad_y, amplitude,
+            )
+            frequency *= lacunarity
+            amplitude *= persistence
+            continue
+
+        # Gradient indices for the four corners around each pixel
+        fx = fx[np.newaxis, :]
+        fy = fy[:, np.newaxis]
+        g00 = perm[(cx0[np.newaxis, :] + ry0[:, np.newaxis]) & _PERM_MASK]
+        g10 = perm[(cx1[np.newaxis, :] + ry0[:, np.newaxis]) & _PERM_MASK]
+        g01 = perm[(cx0[np.newaxis, :] + ry1[:, np.newaxis]) & _PERM_MASK]
+        g11 = perm[(cx1[np.newaxis, :] + ry1[:, np.newaxis]) & _PERM_MASK]
+        n00 = grad_x[g00] * fx + grad_y[g00] * fy
+        n10 = grad_x[g10] * (fx - 1) + grad_y[g10] * fy
+        n01 = grad_x[g01] * fx + grad_y[g01] * (fy - 1)
+        n11 = grad_x[g11] * (fx - 1) + grad_y[g11] * (fy - 1)
+
+        # Blend the corner ramps with the fade curve
+        u = _fade(fx)
+        v = _fade(fy)
+        n0 = n00 + u * (n10 - n00)
+        n1 = n01 + u * (n11 - n01)
+        noise += amplitude * (n0 + v * (n1 - n0))
+
+        frequency *= lacunarity
+        amplitude *= persistence
+
+    return noise
+
+
+@functools.lru_cache(maxsize=16)
+def _vignette_mask(width, height, vignette_strength):
+    """
+    Radial vignette weights for a (height, width) noise map.
+
+    Cached because board dimensions and strength rarely change between
+    samples. The returned array is read-only and shared between callers.
+    """
+    center_x, center_y = width / 2, height / 2
+    max_dist = np.sqrt(center_x**2 + center_y**2)
+
+    # Distance from center, normalized to 0-1
+    xs = np.arange(int(width)) - center_x
+    ys = np.arange(int(height)) - center_y
+    dist = np.sqrt(xs[np.newaxis, :]**2 + ys[:, np.newaxis]**2)
+    norm_dist = dist / max_dist
+
+    # Radial gradient (1 at center, 0 at edges) blended with vignette strength
+    radial_factor = 1 - norm_dist
+    mask = 1 - vignette_strength + (vignette_strength * radial_factor)
+    mask.setflags(write=False)
+    return mask
+
+
 def generate_perlin_noise(width=512, height=512, scale=100.0, octaves=6,
                           persistence=0.5, lacunarity=2.0, seed=None, vignette_strength=0.5):
     """
@@ -413,126 +624,125 @@ def generate_perlin_noise(width=512, height=512, scale=100.0, octaves=6,
         vignette_strength: Strength of radial gradient (0=none, 1=strong)
 
     Returns:
-        2D numpy array of noise values (normalized to 0-1)
+        2D float32 numpy array of noise values (normalized to 0-1)
     """
-    if seed is not None:
-        np.random.seed(seed)
-
-    noise_map = np.zeros((int(height), int(width)))
-
-    for y in range(int(height)):
-        for x in range(int(width)):
-            noise_value = pnoise2(
-                x / scale,
-                y / scale,
-                octaves=octaves,
-                persistence=persistence,
-                lacunarity=lacunarity,
-                repeatx=int(width),
-                repeaty=int(height),
-                base=seed if seed else 0
-            )
-            noise_map[y][x] = noise_value
+    noise_map = _perlin_grid(
+        (int(height), int(width)),
+        scale=scale,
+        octaves=octaves,
+        persistence=persistence,
+        lacunarity=lacunarity,
+        seed=seed,
+    )
 
-    # Normalize to 0-1 range
-    noise_map = (noise_map - noise_map.min()) / (noise_map.max() - noise_map.min())
+    # Shift to a zero minimum, in place
+    noise_map -= noise_map.min()
 
-    # Apply radial vignette (center bias)
     if vignette_strength > 0:
-        center_x, center_y = width / 2, height / 2
-        max_dist = np.sqrt(center_x**2 + center_y**2)
-
-        for y in range(int(height)):
-            for x in range(int(width)):
-                # Calculate distance from center
-                dist = np.sqrt((x - center_x)**2 + (y - center_y)**2)
-                # Normalize distance to 0-1
-                norm_dist = dist / max_dist
-                # Apply radial gradient (1 at center, 0 at edges)
-                radial_factor = 1 - norm_dist
-                # Blend with vignette strength
-                vignette = 1 - vignette_strength + (vignette_strength * radial_factor)
-                # Apply to noise
-                noise_map[y, x] = noise_map[y, x] * vignette
-
-    # Re-normalize after vignette
-    if vignette_strength > 0:
-        noise_map = (noise_map - noise_map.min()) / (noise_map.max() - noise_map.min())
+        # Apply radial vignette (center bias). The final normalization ignores
+        # positive scaling, so dividing by the range first would be wasted work
+        noise_map *= _vignette_mask(width, height, vignette_strength)
+        noise_map -= noise_map.min()
 
-    return noise_map
+    # Normalize to 0-1 range
+    noise_map /= noise_map.max()
 
+    # The map is only used for threshold lookups - float32 halves its footprint
+    return noise_map.astype(np.float32)
 
-def create_adaptive_grid(noise_map, grid_sizes=None, padding=0.3):
+
+def _adaptive_grid_loops(noise_map, sizes, padding, cells):
     """
-    Create an adaptive grid where cell size varies based on noise values.
-    Uses discrete logarithmic step sizes with a decreasing pattern.
-    High noise = larger cells, low noise = smaller cells.
+    Tile the noise map row by row into cells sized by the local noise value.
 
-    Args:
-        noise_map: 2D numpy array of noise values
-        grid_sizes: List of 5 discrete grid sizes [largest, ..., smallest] in mm
-        padding: Padding in mm between grid cells (for component spacing)
+    Scalar kernel behind create_adaptive_grid; written without Python objects
+    so Numba can compile it. Rows are written into the preallocated `cells`
+    array as (x, y, width, height, noise_value).
 
     Returns:
-        List of tuples: (x, y, width, height, noise_value) for each grid cell in mm
+        Number of cells written
     """
-    # Define discrete cell sizes in mm (logarithmic decreasing pattern)
-    if grid_sizes is None:
-        discrete_sizes = [24.4, 14.6, 13.5, 3.6, 1.5]  # mm
-    else:
-        discrete_sizes = grid_sizes
-
-    def get_cell_size(noise_value):
-        """Map noise value to discrete cell size."""
-        # Higher noise -> index closer to 0 (larger size)
-        # Lower noise -> index closer to end (smaller size)
-        index = int((1 - noise_value) * (len(discrete_sizes) - 1))
-        index = max(0, min(len(discrete_sizes) - 1, index))
-        return discrete_sizes[index]
-
     height, width = noise_map.shape
-    grid_cells = []
+    last = sizes.shape[0] - 1
+    count = 0
 
-    y = 0
+    y = 0.0
     while y < height:
-        x = 0
-        row_height = None
+        x = 0.0
+        row_height = -1.0
 
         while x < width:
-            # Sample noise at current position
-            temp_noise = noise_map[min(int(y), int(height)-1), min(int(x), int(width)-1)]
-            cell_size = get_cell_size(temp_noise)
+            # Sample noise at current position and map it to a discrete size:
+            # higher noise -> index closer to 0 (larger size)
+            temp_noise = noise_map[min(int(y), height - 1), min(int(x), width - 1)]
+            index = int((np.float32(1) - temp_noise) * np.float32(last))
+            index = max(0, min(last, index))
+            cell_size = sizes[index]
 
             # Calculate actual cell dimensions (don't exceed boundaries)
             cell_width = min(cell_size, width - x)
 
-            # For the first cell in the row, determine the row height
-            if row_height is None:
+            # The first cell in the row determines the row height; all cells
+            # in this row use the same height for perfect tiling
+            if row_height < 0:
                 row_height = min(cell_size, height - y)
-
-            # All cells in this row use the same height for perfect tiling
             cell_height = row_height
 
             # NOW sample noise at the CENTER of this cell
-            center_x = int(x + cell_width / 2)
-            center_y = int(y + cell_height / 2)
-            center_x = min(center_x, int(width) - 1)
-            center_y = min(center_y, int(height) - 1)
-            noise_value = noise_map[center_y, center_x]
+            center_x = min(int(x + cell_width / 2), width - 1)
+            center_y = min(int(y + cell_height / 2), height - 1)
 
             # Apply padding to create spacing between cells
-            padded_x = x + padding
-            padded_y = y + padding
-            padded_width = max(0.1, cell_width - 2 * padding)
-            padded_height = max(0.1, cell_height - 2 * padding)
-
-            grid_cells.append((padded_x, padded_y, padded_width, padded_height, noise_value))
+            cells[count, 0] = x + padding
+            cells[count, 1] = y + padding
+            cells[count, 2] = max(0.1, cell_width - 2 * padding)
+            cells[count, 3] = max(0.1, cell_height - 2 * padding)
+            cells[count, 4] = noise_map[center_y, center_x]
+            count += 1
 
             x += cell_width
 
         y += row_height
 
-    return grid_cells
+    return count
+
+
+# JIT-compiled grid kernel when Numba is installed, else plain Python
+_adaptive_grid_jit = njit(cache=True)(_adaptive_grid_loops) if njit else None
+
+
+def create_adaptive_grid(noise_map, grid_sizes=None, padding=0.3):
+    """
+    Create an adaptive grid where cell size varies based on noise values.
+    Uses discrete logarithmic step sizes with a decreasing pattern.
+    High noise = larger cells, low noise = smaller cells.
+
+    Args:
+        noise_map: 2D numpy array of noise values
+        grid_sizes: List of 5 discrete grid sizes [largest, ..., smallest] in mm
+        padding: Padding in mm between grid cells (for component spacing)
+
+    Returns:
+        (N, 5) float64 array with one (x, y, width, height, noise_value) row
+        per grid cell, in mm
+    """
+    # Define discrete cell sizes in mm (logarithmic decreasing pattern)
+    if grid_sizes is None:
+        discrete_sizes = [24.4, 14.6, 13.5, 3.6, 1.5]  # mm
+    else:
+        discrete_sizes = grid_sizes
+    sizes = np.asarray(discrete_sizes, dtype=np.float64)
+
+    # Every cell but the last in a row/column is at least the smallest size
+    height, width = noise_map.shape
+    min_size = sizes.min()
+    max_cells = int(np.ceil(height / min_size)) * int(np.ceil(width / min_size))
+    cells = np.empty((max_cells, 5))
+
+    kernel = _adaptive_grid_jit if _adaptive_grid_jit is not None else _adaptive_grid_loops
+    count = kernel(noise_map, sizes, padding, cells)
+
+    return cells[:count]
 
 
 def create_grid_points_for_cell(cell_x, cell_y, cell_w, cell_h, grid_spacing):
@@ -545,10 +755,8 @@ def create_grid_points_for_cell(cell_x, cell_y, cell_w, cell_h, grid_spacing):
         grid_spacing: Grid spacing in mm
 
     Returns:
-        List of (x, y) tuples representing grid points in mm
+        (N, 2) array of (x, y) grid points in mm, column by column
     """
-    grid_points = []
-
     # Calculate number of grid points that fit in this cell
     num_points_x = max(1, int(cell_w / grid_spacing))
     num_points_y = max(1, int(cell_h / grid_spacing))
@@ -557,215 +765,385 @@ def create_grid_points_for_cell(cell_x, cell_y, cell_w, cell_h, grid_spacing):
     actual_spacing_x = cell_w / num_points_x
     actual_spacing_y = cell_h / num_points_y
 
-    for i in range(num_points_x):
-        for j in range(num_points_y):
-            point_x = cell_x + actual_spacing_x * (i + 0.5)
-            point_y = cell_y + actual_spacing_y * (j + 0.5)
-            grid_points.append((point_x, point_y))
-
-    return grid_points
-
-
-def place_components_with_perlin_noise(
-    board_width: float,
-    board_height: float,
-    params: Optional[Dict] = None
-) -> List[Component]:
+    xs = cell_x + actual_spacing_x * (np.arange(num_points_x) + 0.5)
+    ys = cell_y + actual_spacing_y * (np.arange(num_points_y) + 0.5)
+
+    return np.column_stack((np.repeat(xs, num_points_y), np.tile(ys, num_points_x)))
+
+
+# Component footprints by category: (width, height, num_pins, footprint_name)
+# Large components (for Size 1 cells)
+_LARGE_FOOTPRINTS = (
+    (14.0, 14.0, 100, 'qfp100'),    # QFP-100
+    (20.0, 20.0, 144, 'qfp144'),    # QFP-144
+    (11.0, 11.0, 100, 'bga100'),    # BGA-100
+    (13.0, 13.0, 144, 'bga144'),    # BGA-144
+    (17.0, 17.0, 256, 'bga256'),    # BGA-256
+    # Large radial capacitors
+    (10.0, 10.0, 2, 'cap_radial_10mm'),  # 10mm radial cap
+)
+
+# Medium components (for Size 3 cells)
+_MEDIUM_FOOTPRINTS = (
+    (3.9, 4.9, 8, 'soic8'),         # SOIC-8
+    (3.9, 8.7, 14, 'soic14'),       # SOIC-14
+    (3.9, 9.9, 16, 'soic16'),       # SOIC-16
+    (4.4, 5.0, 14, 'tssop14'),      # TSSOP-14
+    (4.4, 5.0, 16, 'tssop16'),      # TSSOP-16
+    (4.4, 6.5, 20, 'tssop20'),      # TSSOP-20
+    (7.0, 7.0, 32, 'qfp32'),        # QFP-32
+    (10.0, 10.0, 44, 'qfp44'),      # QFP-44
+    (7.0, 7.0, 48, 'qfp48'),        # QFP-48
+    (10.0, 10.0, 64, 'qfp64'),      # QFP-64
+    # Radial capacitors
+    (5.0, 5.0, 2, 'cap_radial_5mm'),      # 5mm radial cap
+    (6.3, 6.3, 2, 'cap_radial_6mm'),      # 6mm radial cap
+    (8.0, 8.0, 2, 'cap_radial_8mm'),      # 8mm radial cap
+)
+
+# Small-medium components (for Size 4 cells)
+_SMALL_MED_FOOTPRINTS = (
+    (2.0, 1.25, 2, 'resistor_0805'),   # 0805 resistor
+    (3.2, 1.6, 2, 'resistor_1206'),    # 1206 resistor
+    (2.0, 1.25, 2, 'capacitor_0805'),  # 0805 capacitor
+    (3.2, 1.6, 2, 'capacitor_1206'),   # 1206 capacitor
+    (2.0, 1.25, 2, 'inductor_0805'),   # 0805 inductor
+    (2.7, 1.6, 2, 'diode_sod123'),     # SOD-123 diode
+    (2.0, 1.25, 2, 'led_0805'),        # 0805 LED
+)
+
+# Small components (for Size 2 and Size 5 cells)
+_SMALL_FOOTPRINTS = (
+    (1.0, 0.5, 2, 'resistor_0402'),    # 0402 resistor
+    (1.6, 0.8, 2, 'resistor_0603'),    # 0603 resistor
+    (1.0, 0.5, 2, 'capacitor_0402'),   # 0402 capacitor
+    (1.6, 0.8, 2, 'capacitor_0603'),   # 0603 capacitor
+    (1.6, 0.8, 2, 'led_0603'),         # 0603 LED
+)
+
+# Connectors (placed in edge zones only)
+_CONNECTOR_FOOTPRINTS = (
+    (2.54, 5.08, 2, 'connector_2pin'),     # 2-pin header
+    (2.54, 10.16, 4, 'connector_4pin'),    # 4-pin header
+    (2.54, 15.24, 6, 'connector_6pin'),    # 6-pin header
+    (2.54, 20.32, 8, 'connector_8pin'),    # 8-pin header
+    (2.54, 25.4, 10, 'connector_10pin'),   # 10-pin header
+    (5.08, 12.7, 10, 'connector_2x5'),     # 2x5 header
+    (5.08, 20.32, 16, 'connector_2x8'),    # 2x8 header
+    (4.0, 7.0, 2, 'jst_2pin'),             # JST 2-pin
+    (8.0, 7.0, 4, 'jst_4pin'),             # JST 4-pin
+    (12.0, 7.0, 6, 'jst_6pin'),            # JST 6-pin
+    (16.0, 7.0, 8, 'jst_8pin'),            # JST 8-pin
+)
+
+# Test points
+_TESTPOINT_FOOTPRINTS = (
+    (1.0, 1.0, 1, 'testpoint_1mm'),
+    (1.5, 1.5, 1, 'testpoint_1_5mm'),
+    (2.0, 2.0, 1, 'testpoint_2mm'),
+)
+
+# Integer codes used by PerlinPlacer.generate_placements_array
+SIZE_CATEGORIES = ('large', 'medium', 'small')
+FOOTPRINT_NAMES = tuple(dict.fromkeys(
+    name
+    for table in (_LARGE_FOOTPRINTS, _MEDIUM_FOOTPRINTS, _SMALL_MED_FOOTPRINTS,
+                  _SMALL_FOOTPRINTS, _CONNECTOR_FOOTPRINTS, _TESTPOINT_FOOTPRINTS)
+    for _, _, _, name in table
+))
+
+# Discrete choices, drawn as _ROTATIONS[rng.integers(0, 4)] - the same
+# draw as rng.choice() without converting the sequence to an array per call
+_ROTATIONS = (0, 90, 180, 270)
+_ROTATION_SWAPS_AXES = (False, True, False, True)  # width/height swap per _ROTATIONS entry
+_EDGES = ('left', 'right', 'top', 'bottom')
+
+
+def _screen_cell_loops(points, order, noise_map, comp_w, comp_h, half_w, half_h,
+                       board_width, board_height, edge_margin, threshold,
+                       bounds, count, max_width, min_clearance, keys, locations):
     """
-    Place components on a PCB using Perlin noise-based placement algorithm.
+    Screen a cell's grid points for one component in a single pass.
 
-    Args:
-        board_width: Board width in mm
-        board_height: Board height in mm
-        params: Dictionary of algorithm parameters (uses defaults if None)
+    Scalar kernel behind _Placer.try_place_component; does the same keep-out,
+    clamp, noise threshold and PlacementIndex overlap tests as the NumPy path,
+    point by point in `order`. The packed key and clamped location of every
+    surviving point are written to `keys` and `locations`.
 
     Returns:
-        List of placed Component objects
+        Number of surviving points
     """
-    # Default parameters (good values from testing)
-    if params is None:
-        params = {
-            'seed': 114,
-            'scale': 343.8,
-            'octaves': 8,
-            'persistence': 0.2055,
-            'lacunarity': 3.276,
-            'vignette_strength': 0.882,
-            'grid_sizes': [24.4, 14.6, 13.5, 3.6, 1.5],  # mm
-            'large_count': 1,
-            'medium_count': 24,
-            'small_med_count': 89,
-            'small_count': 186,
-            'large_spacing': 7.8,      # mm
-            'medium_spacing': 2.1,     # mm
-            'small_med_spacing': 1.4,  # mm
-            'small_spacing': 1.0,      # mm
-        }
+    map_height, map_width = noise_map.shape
+    half_cw = comp_w / 2
+    half_ch = comp_h / 2
+    xmins = bounds[:count, 0]
+
+    # Keep-out and clamp limits for this footprint
+    keepout_x = board_width - edge_margin
+    keepout_y = board_height - edge_margin
+    clamp_x = board_width - half_cw
+    clamp_y = board_height - half_ch
+    n = 0
+
+    for j in range(order.shape[0]):
+        x = points[order[j], 0]
+        y = points[order[j], 1]
+
+        # Skip edge keep-out zones
+        if not (x - half_cw >= edge_margin and x + half_cw <= keepout_x and
+                y - half_ch >= edge_margin and y + half_ch <= keepout_y):
+            continue
+
+        # Clamp to bounds and test the noise threshold (Component.can_place)
+        clamped_x = max(half_cw, min(clamp_x, x))
+        clamped_y = max(half_ch, min(clamp_y, y))
+        if not (clamped_x >= 0 and clamped_x < map_width and clamped_y >= 0 and clamped_y < map_height):
+            continue
+        if not noise_map[int(clamped_y), int(clamped_x)] >= threshold:
+            continue
+
+        # Overlap scan over the sort-and-sweep window, as in PlacementIndex
+        qxmin = (clamped_x - half_w) - min_clearance
+        qxmax = (clamped_x + half_w) + min_clearance
+        qymax = (clamped_y + half_h) + min_clearance
+        neg_qxmin = -qxmin
+        neg_qymin = -((clamped_y - half_h) - min_clearance)
+        hit = False
+        for i in range(np.searchsorted(xmins, qxmin - max_width), np.searchsorted(xmins, qxmax)):
+            if (bounds[i, 0] < qxmax and bounds[i, 1] < qymax and
+                    bounds[i, 2] < neg_qxmin and bounds[i, 3] < neg_qymin):
+                hit = True
+                break
+        if hit:
+            continue
+
+        # Unique key for the grid point at 0.1mm precision
+        keys[n] = int(x * 10) * 1_000_000 + int(y * 10)
+        locations[n, 0] = clamped_x
+        locations[n, 1] = clamped_y
+        n += 1
+
+    return n
+
+
+# Compiled cell screen when Numba is installed; without it try_place_component
+# screens each cell with NumPy array operations instead
+_screen_cell_jit = njit(cache=True)(_screen_cell_loops) if njit else None
+
+
+class _Placer:
+    """
+    Per-board placement state and the placement steps that act on it.
 
-    # Generate Perlin noise
-    noise_map = generate_perlin_noise(
-        width=board_width,
-        height=board_height,
-        scale=params.get('scale', 343.8),
-        octaves=int(params.get('octaves', 8)),
-        persistence=params.get('persistence', 0.2055),
-        lacunarity=params.get('lacunarity', 3.276),
-        seed=int(params.get('seed', 114)),
-        vignette_strength=params.get('vignette_strength', 0.882)
-    )
+    One instance is built for each call to place_components_with_perlin_noise;
+    the hot methods bind the attributes they use to locals up front.
+    """
 
-    # Create adaptive grid
-    grid_sizes = params.get('grid_sizes', [24.4, 14.6, 13.5, 3.6, 1.5])
-    grid_cells = create_adaptive_grid(noise_map, grid_sizes)
+    __slots__ = ('board_width', 'board_height', 'edge_margin', 'noise_map',
+                 'grid_cells', 'cell_noise', 'rng', 'placed_components',
+                 'placed_index', 'occupied_points', 'grid_point_cache')
 
-    # Categorize cells by size
-    grid_size_1 = grid_sizes[0]
-    grid_size_2 = grid_sizes[1]
-    grid_size_3 = grid_sizes[2]
-    grid_size_4 = grid_sizes[3]
+    def __init__(self, board_width, board_height, noise_map, grid_cells, rng):
+        """
+        Args:
+            board_width: Board width in mm
+            board_height: Board height in mm
+            noise_map: Perlin noise map, one value per mm
+            grid_cells: (N, 5) array of cells from create_adaptive_grid
+            rng: NumPy Generator driving every random choice
+        """
+        self.board_width = board_width
+        self.board_height = board_height
+        # Edge keep-out zone (10% from each edge)
+        self.edge_margin = board_width * 0.1
+        self.noise_map = noise_map
+        self.grid_cells = grid_cells
+        self.cell_noise = grid_cells[:, 4].tolist()
+        self.rng = rng
+
+        # Placement tracking
+        self.placed_components = []
+        self.placed_index = PlacementIndex()
+        self.occupied_points = set()
+
+        # Grid points per (cell index, spacing); the same cells are revisited by
+        # every attempt and across the placement passes
+        self.grid_point_cache = {}
+
+    def add_placed(self, component):
+        """Record a placed component in the output list and collision index."""
+        self.placed_components.append(component)
+        self.placed_index.insert(component)
+
+    def place_repeatedly(self, count, place_one, max_failures=None, on_placed=None):
+        """
+        Run one placement pass: call place_one up to `count` times.
+
+        Args:
+            count: Number of components to attempt
+            place_one: Callable returning a placed Component or None
+            max_failures: Stop the pass after this many consecutive failed
+                attempts (None = always make all `count` attempts)
+            on_placed: Optional callback for each placed component, run
+                after it is recorded
+        """
+        failures = 0
+        for _ in range(count):
+            component = place_one()
+            if component is None:
+                failures += 1
+                if max_failures is not None and failures >= max_failures:
+                    logger.debug(f"Stopping placement pass after {failures} consecutive failures")
+                    break
+                continue
 
-    size_1_cells = [(x, y, w, h, nv) for x, y, w, h, nv in grid_cells if w >= grid_size_1 - 1.0]
-    size_2_cells = [(x, y, w, h, nv) for x, y, w, h, nv in grid_cells if grid_size_2 - 1.0 <= w < grid_size_1 - 1.0]
-    size_3_cells = [(x, y, w, h, nv) for x, y, w, h, nv in grid_cells if grid_size_3 - 0.5 <= w < grid_size_2 - 1.0]
-    size_4_cells = [(x, y, w, h, nv) for x, y, w, h, nv in grid_cells if grid_size_4 - 0.5 <= w < grid_size_3 - 0.5]
-    size_5_cells = [(x, y, w, h, nv) for x, y, w, h, nv in grid_cells if w < grid_size_4 - 0.5]
-
-    # Initialize placement tracking
-    placed_components = []
-    occupied_points = set()
-    np.random.seed(int(params.get('seed', 114)))
-
-    # Define component footprints by category
-    # Large components (for Size 1 cells)
-    LARGE_FOOTPRINTS = [
-        (14.0, 14.0, 100, 'qfp100'),    # QFP-100
-        (20.0, 20.0, 144, 'qfp144'),    # QFP-144
-        (11.0, 11.0, 100, 'bga100'),    # BGA-100
-        (13.0, 13.0, 144, 'bga144'),    # BGA-144
-        (17.0, 17.0, 256, 'bga256'),    # BGA-256
-        # Large radial capacitors
-        (10.0, 10.0, 2, 'cap_radial_10mm'),  # 10mm radial cap
-    ]
-
-    # Medium components (for Size 3 cells)
-    MEDIUM_FOOTPRINTS = [
-        (3.9, 4.9, 8, 'soic8'),         # SOIC-8
-        (3.9, 8.7, 14, 'soic14'),       # SOIC-14
-        (3.9, 9.9, 16, 'soic16'),       # SOIC-16
-        (4.4, 5.0, 14, 'tssop14'),      # TSSOP-14
-        (4.4, 5.0, 16, 'tssop16'),      # TSSOP-16
-        (4.4, 6.5, 20, 'tssop20'),      # TSSOP-20
-        (7.0, 7.0, 32, 'qfp32'),        # QFP-32
-        (10.0, 10.0, 44, 'qfp44'),      # QFP-44
-        (7.0, 7.0, 48, 'qfp48'),        # QFP-48
-        (10.0, 10.0, 64, 'qfp64'),      # QFP-64
-        # Radial capacitors
-        (5.0, 5.0, 2, 'cap_radial_5mm'),      # 5mm radial cap
-        (6.3, 6.3, 2, 'cap_radial_6mm'),      # 6mm radial cap
-        (8.0, 8.0, 2, 'cap_radial_8mm'),      # 8mm radial cap
-    ]
-
-    # Small-medium components (for Size 4 cells)
-    SMALL_MED_FOOTPRINTS = [
-        (2.0, 1.25, 2, 'resistor_0805'),   # 0805 resistor
-        (3.2, 1.6, 2, 'resistor_1206'),    # 1206 resistor
-        (2.0, 1.25, 2, 'capacitor_0805'),  # 0805 capacitor
-        (3.2, 1.6, 2, 'capacitor_1206'),   # 1206 capacitor
-        (2.0, 1.25, 2, 'inductor_0805'),   # 0805 inductor
-        (2.7, 1.6, 2, 'diode_sod123'),     # SOD-123 diode
-        (2.0, 1.25, 2, 'led_0805'),        # 0805 LED
-    ]
-
-    # Small components (for Size 2 and Size 5 cells)
-    SMALL_FOOTPRINTS = [
-        (1.0, 0.5, 2, 'resistor_0402'),    # 0402 resistor
-        (1.6, 0.8, 2, 'resistor_0603'),    # 0603 resistor
-        (1.0, 0.5, 2, 'capacitor_0402'),   # 0402 capacitor
-        (1.6, 0.8, 2, 'capacitor_0603'),   # 0603 capacitor
-        (1.6, 0.8, 2, 'led_0603'),         # 0603 LED
-    ]
-
-    # Connectors (placed in edge zones only)
-    CONNECTOR_FOOTPRINTS = [
-        (2.54, 5.08, 2, 'connector_2pin'),     # 2-pin header
-        (2.54, 10.16, 4, 'connector_4pin'),    # 4-pin header
-        (2.54, 15.24, 6, 'connector_6pin'),    # 6-pin header
-        (2.54, 20.32, 8, 'connector_8pin'),    # 8-pin header
-        (2.54, 25.4, 10, 'connector_10pin'),   # 10-pin header
-        (5.08, 12.7, 10, 'connector_2x5'),     # 2x5 header
-        (5.08, 20.32, 16, 'connector_2x8'),    # 2x8 header
-        (4.0, 7.0, 2, 'jst_2pin'),             # JST 2-pin
-        (8.0, 7.0, 4, 'jst_4pin'),             # JST 4-pin
-        (12.0, 7.0, 6, 'jst_6pin'),            # JST 6-pin
-        (16.0, 7.0, 8, 'jst_8pin'),            # JST 8-pin
-    ]
-
-    # Test points
-    TESTPOINT_FOOTPRINTS = [
-        (1.0, 1.0, 1, 'testpoint_1mm'),
-        (1.5, 1.5, 1, 'testpoint_1_5mm'),
-        (2.0, 2.0, 1, 'testpoint_2mm'),
-    ]
-
-    # Edge keep-out zone (10% from each edge)
-    edge_margin = board_width * 0.1
-
-    def is_in_keepout(x, y, comp_w, comp_h):
-        """Check if component would be in edge keep-out zone."""
-        return (x - comp_w/2 < edge_margin or
-                x + comp_w/2 > board_width - edge_margin or
-                y - comp_h/2 < edge_margin or
-                y + comp_h/2 > board_height - edge_margin)
-
-    def try_place_component(footprints, preferred_cells, all_cells, grid_spacing, comp_type='generic', allow_rotation=True):
+            failures = 0
+            self.add_placed(component)
+            if on_placed is not None:
+                on_placed(component)
+
+    def cell_grid_points(self, cell_idx, grid_spacing):
+        """Grid points of a cell as an (N, 2) array, computed once per spacing."""
+        key = (cell_idx, grid_spacing)
+        points = self.grid_point_cache.get(key)
+        if points is None:
+            cell_x, cell_y, cell_w, cell_h = self.grid_cells[cell_idx, :4].tolist()
+            points = create_grid_points_for_cell(cell_x, cell_y, cell_w, cell_h, grid_spacing)
+            self.grid_point_cache[key] = points
+        return points
+
+    def _screen_cell(self, grid_points, comp_w, comp_h, half_w, half_h, noise_value, min_spacing):
+        """
+        NumPy version of _screen_cell_loops for when Numba is not installed.
+
+        Returns:
+            (point_keys, locations) lists for the grid points that pass the
+            keep-out, noise threshold and overlap tests, in grid_points order
+        """
+        board_width = self.board_width
+        board_height = self.board_height
+        edge_margin = self.edge_margin
+        noise_map = self.noise_map
+        map_height, map_width = noise_map.shape
+        xs = grid_points[:, 0]
+        ys = grid_points[:, 1]
+
+        # Skip edge keep-out zones
+        valid = ((xs - comp_w/2 >= edge_margin) & (xs + comp_w/2 <= board_width - edge_margin) &
+                 (ys - comp_h/2 >= edge_margin) & (ys + comp_h/2 <= board_height - edge_margin))
+
+        # Clamp to bounds
+        clamped_x = np.maximum(comp_w/2, np.minimum(board_width - comp_w/2, xs))
+        clamped_y = np.maximum(comp_h/2, np.minimum(board_height - comp_h/2, ys))
+
+        # Noise threshold test (Component.can_place) for the whole cell in one gather
+        valid &= (clamped_x >= 0) & (clamped_x < map_width) & (clamped_y >= 0) & (clamped_y < map_height)
+        candidates = np.flatnonzero(valid)
+        noise_ok = noise_map[clamped_y[candidates].astype(np.intp),
+                             clamped_x[candidates].astype(np.intp)] >= noise_value * 0.8
+
+        candidates = candidates[noise_ok]
+        if not len(candidates):
+            return [], []
+
+        # Reject candidates that collide with placed components in one batch
+        cand_x = clamped_x[candidates]
+        cand_y = clamped_y[candidates]
+        bounds = np.column_stack((cand_x - half_w, cand_y - half_h, cand_x + half_w, cand_y + half_h))
+        clear = ~self.placed_index.overlaps_batch(bounds, min_clearance=min_spacing)
+
+        survivors = candidates[clear]
+
+        # Unique keys for the surviving grid points at 0.1mm precision,
+        # packed as x_key * 1_000_000 + y_key so the set holds plain ints
+        point_keys = ((xs[survivors] * 10).astype(np.int64) * 1_000_000 +
+                      (ys[survivors] * 10).astype(np.int64)).tolist()
+        locations = np.column_stack((clamped_x[survivors], clamped_y[survivors])).tolist()
+
+        return point_keys, locations
+
+    def try_place_component(self, footprints, preferred_cells, all_cells, grid_spacing, comp_type='generic', allow_rotation=True):
         """Try to place a component on grid points."""
+        rng = self.rng
+
         # Randomly select a footprint
-        comp_w, comp_h, num_pins, footprint_name = footprints[np.random.randint(0, len(footprints))]
+        comp_w, comp_h, num_pins, footprint_name = footprints[rng.integers(0, len(footprints))]
 
         # Random rotation for non-square components
         rotation = 0
-        if allow_rotation and comp_w != comp_h and np.random.random() < 0.5:
-            rotation = np.random.choice([0, 90, 180, 270])
+        if allow_rotation and comp_w != comp_h and rng.random() < 0.5:
+            rotation = _ROTATIONS[rng.integers(0, len(_ROTATIONS))]
 
         # Try preferred cells first
-        cells_to_try = preferred_cells if preferred_cells else all_cells
-        if not cells_to_try:
+        cells_to_try = preferred_cells if len(preferred_cells) else all_cells
+        if not len(cells_to_try):
             return None
 
         # Shuffle for randomness
-        shuffled_cells = cells_to_try.copy()
-        np.random.shuffle(shuffled_cells)
+        shuffled_cells = cells_to_try[rng.permutation(len(cells_to_try))]
 
         # Try more cells if we have many to choose from
         max_attempts = min(50, len(shuffled_cells))
 
-        for cell_x, cell_y, cell_w, cell_h, noise_value in shuffled_cells[:max_attempts]:
-            # Generate grid points for this cell
-            grid_points = create_grid_points_for_cell(cell_x, cell_y, cell_w, cell_h, grid_spacing)
-
-            # Shuffle grid points
-            np.random.shuffle(grid_points)
-
-            for comp_x, comp_y in grid_points:
-                # Create unique key for this grid point
-                point_key = (int(comp_x * 10), int(comp_y * 10))  # 0.1mm precision
+        # Increase spacing for high-pin-count components
+        # Use much larger clearances to prevent overlaps
+        if num_pins > 64:
+            min_spacing = 3.0  # Large ICs need significant clearance
+        elif num_pins > 16:
+            min_spacing = 2.0  # Medium ICs need moderate clearance
+        else:
+            min_spacing = 1.5  # Small components need minimum clearance
+
+        # Rotated half-extent, matching Component.get_bounds
+        if rotation == 90 or rotation == 270:
+            half_w, half_h = comp_h / 2, comp_w / 2
+        else:
+            half_w, half_h = comp_w / 2, comp_h / 2
+
+        board_width = self.board_width
+        board_height = self.board_height
+        edge_margin = self.edge_margin
+        noise_map = self.noise_map
+        cell_noise = self.cell_noise
+        placed_index = self.placed_index
+        occupied_points = self.occupied_points
+        cell_grid_points = self.cell_grid_points
+
+        for cell_idx in shuffled_cells[:max_attempts].tolist():
+            noise_value = cell_noise[cell_idx]
+
+            # Shuffle this cell's grid points (gathering rows by a permutation
+            # uses the same draws as an in-place shuffle and keeps the cache intact)
+            grid_points = cell_grid_points(cell_idx, grid_spacing)
+            order = rng.permutation(len(grid_points))
+
+            if _screen_cell_jit is not None:
+                # The map is float32, so compare against a float32 threshold
+                # exactly as the NumPy comparison below does
+                keys = np.empty(len(order), dtype=np.int64)
+                locations = np.empty((len(order), 2))
+                count = _screen_cell_jit(
+                    grid_points, order, noise_map, comp_w, comp_h, half_w, half_h,
+                    board_width, board_height, edge_margin, np.float32(noise_value * 0.8),
+                    placed_index._bounds, len(placed_index), placed_index._max_width,
+                    min_spacing, keys, locations
+                )
+                point_keys = keys[:count].tolist()
+                locations = locations[:count].tolist()
+            else:
+                point_keys, locations = self._screen_cell(
+                    grid_points[order], comp_w, comp_h, half_w, half_h, noise_value, min_spacing
+                )
 
+            for point_key, location in zip(point_keys, locations):
                 # Skip if already occupied
                 if point_key in occupied_points:
                     continue
 
-                # Skip edge keep-out zones
-                if is_in_keepout(comp_x, comp_y, comp_w, comp_h):
-                    continue
-
-                # Clamp to bounds
-                comp_x = max(comp_w/2, min(board_width - comp_w/2, comp_x))
-                comp_y = max(comp_h/2, min(board_height - comp_h/2, comp_y))
-
                 component = Component(
                     size=(comp_w, comp_h),
                     num_pins=num_pins,
-                    location=(comp_x, comp_y),
+                    location=tuple(location),
                     threshold=noise_value * 0.8,
                     rotation=rotation,
                     comp_type=comp_type
@@ -774,30 +1152,17 @@ def place_components_with_perlin_noise(
                 # Store footprint name for later use
                 component.footprint_name = footprint_name
 
-                # Increase spacing for high-pin-count components
-                # Use much larger clearances to prevent overlaps
-                if num_pins > 64:
-                    min_spacing = 3.0  # Large ICs need significant clearance
-                elif num_pins > 16:
-                    min_spacing = 2.0  # Medium ICs need moderate clearance
-                else:
-                    min_spacing = 1.5  # Small components need minimum clearance
-
-                # Check collision
-                can_place = True
-                for placed in placed_components:
-                    if component.overlaps_with(placed, min_clearance=min_spacing):
-                        can_place = False
-                        break
-
-                if can_place and component.can_place(noise_map, []):
-                    occupied_points.add(point_key)
-                    return component
+                occupied_points.add(point_key)
+                return component
 
         return None
 
-    def place_decoupling_caps_near(large_comp, count=4):
+    def place_decoupling_caps_near(self, large_comp, count=4):
         """Place small decoupling capacitors near a large IC."""
+        board_width = self.board_width
+        board_height = self.board_height
+        edge_margin = self.edge_margin
+
         caps = []
         lx, ly = large_comp.location
         lw, lh = large_comp.size
@@ -831,120 +1196,46 @@ def place_components_with_perlin_noise(
             cap.footprint_name = 'capacitor_0402'
 
             # Check if can place
-            if cap.can_place(noise_map, placed_components + caps):
+            if cap.can_place(self.noise_map, caps) and not self.placed_index.overlaps(cap):
                 caps.append(cap)
 
         return caps
 
-    # Place large components in Size 1 cells
-    for _ in range(int(params.get('large_count', 1))):
-        comp = try_place_component(
-            LARGE_FOOTPRINTS,
-            size_1_cells,
-            grid_cells,
-            grid_spacing=params.get('large_spacing', 7.8),
-            comp_type='large',
-            allow_rotation=False
-        )
-        if comp:
-            placed_components.append(comp)
-
-            # Place decoupling caps
-            caps = place_decoupling_caps_near(comp, count=np.random.randint(2, 5))
-            placed_components.extend(caps)
-
-    # Place small components in Size 2 cells (40% of small components)
-    small_in_size2 = int(params.get('small_count', 186) * 0.4)
-    for _ in range(small_in_size2):
-        comp = try_place_component(
-            SMALL_FOOTPRINTS,
-            size_2_cells,
-            grid_cells,
-            grid_spacing=params.get('small_spacing', 1.0),
-            comp_type='small',
-            allow_rotation=True
-        )
-        if comp:
-            placed_components.append(comp)
-
-    # Place medium components in Size 3 cells
-    for _ in range(int(params.get('medium_count', 24))):
-        comp = try_place_component(
-            MEDIUM_FOOTPRINTS,
-            size_3_cells,
-            grid_cells,
-            grid_spacing=params.get('medium_spacing', 2.1),
-            comp_type='medium',
-            allow_rotation=True
-        )
-        if comp:
-            placed_components.append(comp)
-
-    # Place small-medium components in Size 4 cells
-    for _ in range(int(params.get('small_med_count', 89))):
-        comp = try_place_component(
-            SMALL_MED_FOOTPRINTS,
-            size_4_cells,
-            grid_cells,
-            grid_spacing=params.get('small_med_spacing', 1.4),
-            comp_type='small_med',
-            allow_rotation=True
-        )
-        if comp:
-            placed_components.append(comp)
-
-    # Place remaining small components in Size 5 cells (60% of small components)
-    small_in_size5 = int(params.get('small_count', 186) * 0.6)
-    for _ in range(small_in_size5):
-        comp = try_place_component(
-            SMALL_FOOTPRINTS,
-            size_5_cells,
-            grid_cells,
-            grid_spacing=params.get('small_spacing', 1.0),
-            comp_type='small',
-            allow_rotation=True
-        )
-        if comp:
-            placed_components.append(comp)
-
-    # Place connectors in edge zones only
-    def is_in_edge_zone(x, y, comp_w, comp_h):
-        """Check if component is in the edge zone (within edge_margin of board edge)."""
-        in_left_edge = (x - comp_w/2 >= 0 and x + comp_w/2 <= edge_margin)
-        in_right_edge = (x - comp_w/2 >= board_width - edge_margin and x + comp_w/2 <= board_width)
-        in_top_edge = (y - comp_h/2 >= 0 and y + comp_h/2 <= edge_margin)
-        in_bottom_edge = (y - comp_h/2 >= board_height - edge_margin and y + comp_h/2 <= board_height)
-
-        return in_left_edge or in_right_edge or in_top_edge or in_bottom_edge
-
-    def try_place_connector(footprints, num_attempts=100):
+    def try_place_connector(self, footprints, num_attempts=100):
         """Try to place a connector in the edge zone."""
+        rng = self.rng
+        board_width = self.board_width
+        board_height = self.board_height
+        edge_margin = self.edge_margin
+
         for _ in range(num_attempts):
             # Randomly select a footprint
-            comp_w, comp_h, num_pins, footprint_name = footprints[np.random.randint(0, len(footprints))]
+            comp_w, comp_h, num_pins, footprint_name = footprints[rng.integers(0, len(footprints))]
 
             # Random rotation - prefer vertical orientation for connectors
-            rotation = np.random.choice([0, 90, 180, 270])
+            rotation_idx = rng.integers(0, len(_ROTATIONS))
+            rotation = _ROTATIONS[rotation_idx]
 
             # Swap dimensions for rotation
-            display_w, display_h = comp_w, comp_h
-            if rotation in [90, 270]:
+            if _ROTATION_SWAPS_AXES[rotation_idx]:
                 display_w, display_h = comp_h, comp_w
+            else:
+                display_w, display_h = comp_w, comp_h
 
             # Randomly choose which edge
-            edge_choice = np.random.choice(['left', 'right', 'top', 'bottom'])
+            edge_choice = _EDGES[rng.integers(0, len(_EDGES))]
 
             if edge_choice == 'left':
                 comp_x = edge_margin / 2
-                comp_y = np.random.uniform(edge_margin + display_h/2, board_height - edge_margin - display_h/2)
+                comp_y = rng.uniform(edge_margin + display_h/2, board_height - edge_margin - display_h/2)
             elif edge_choice == 'right':
                 comp_x = board_width - edge_margin / 2
-                comp_y = np.random.uniform(edge_margin + display_h/2, board_height - edge_margin - display_h/2)
+                comp_y = rng.uniform(edge_margin + display_h/2, board_height - edge_margin - display_h/2)
             elif edge_choice == 'top':
-                comp_x = np.random.uniform(edge_margin + display_w/2, board_width - edge_margin - display_w/2)
+                comp_x = rng.uniform(edge_margin + display_w/2, board_width - edge_margin - display_w/2)
                 comp_y = edge_margin / 2
             else:  # bottom
-                comp_x = np.random.uniform(edge_margin + display_w/2, board_width - edge_margin - display_w/2)
+                comp_x = rng.uniform(edge_margin + display_w/2, board_width - edge_margin - display_w/2)
                 comp_y = board_height - edge_margin / 2
 
             component = Component(
@@ -959,53 +1250,45 @@ def place_components_with_perlin_noise(
 
             # Check collision with larger clearance for connectors
             min_spacing = 3.0
-            can_place = True
-            for placed in placed_components:
-                if component.overlaps_with(placed, min_clearance=min_spacing):
-                    can_place = False
-                    break
-
-            if can_place:
+            if not self.placed_index.overlaps(component, min_clearance=min_spacing):
                 return component
 
         return None
 
-    # Place connectors
-    connector_count = int(params.get('connector_count', 8))
-    for _ in range(connector_count):
-        conn = try_place_connector(CONNECTOR_FOOTPRINTS)
-        if conn:
-            placed_components.append(conn)
-
-    # Place test points semi-randomly near components (inside IC zone only)
-    def try_place_testpoint(num_attempts=50):
+    def try_place_testpoint(self, num_attempts=50):
         """Try to place a test point near existing components, inside the IC zone."""
+        rng = self.rng
+        board_width = self.board_width
+        board_height = self.board_height
+        edge_margin = self.edge_margin
+        placed_components = self.placed_components
+
+        # Components to place near (prefer non-connectors); nothing is placed
+        # between attempts, so the candidates are the same for every attempt
+        nearby_comps = [c for c in placed_components if c.comp_type != 'connector']
+        if not nearby_comps:
+            nearby_comps = placed_components
+
         for _ in range(num_attempts):
             # Randomly select a test point size
-            tp_w, tp_h, num_pins, footprint_name = TESTPOINT_FOOTPRINTS[np.random.randint(0, len(TESTPOINT_FOOTPRINTS))]
-
-            # Pick a random existing component to place near (prefer non-connectors)
-            if placed_components:
-                # Filter to get non-connector components
-                non_connector_comps = [c for c in placed_components if c.comp_type != 'connector']
+            tp_w, tp_h, num_pins, footprint_name = _TESTPOINT_FOOTPRINTS[rng.integers(0, len(_TESTPOINT_FOOTPRINTS))]
 
-                if non_connector_comps:
-                    nearby_comp = non_connector_comps[np.random.randint(0, len(non_connector_comps))]
-                else:
-                    nearby_comp = placed_components[np.random.randint(0, len(placed_components))]
+            # Pick a random existing component to place near
+            if nearby_comps:
+                nearby_comp = nearby_comps[rng.integers(0, len(nearby_comps))]
 
                 base_x, base_y = nearby_comp.location
 
                 # Place within 5-15mm of the component
-                offset_dist = np.random.uniform(5.0, 15.0)
-                offset_angle = np.random.uniform(0, 2 * np.pi)
+                offset_dist = rng.uniform(5.0, 15.0)
+                offset_angle = rng.uniform(0, 2 * math.pi)
 
-                tp_x = base_x + offset_dist * np.cos(offset_angle)
-                tp_y = base_y + offset_dist * np.sin(offset_angle)
+                tp_x = base_x + offset_dist * math.cos(offset_angle)
+                tp_y = base_y + offset_dist * math.sin(offset_angle)
             else:
                 # Fallback: random position inside IC zone
-                tp_x = np.random.uniform(edge_margin + tp_w/2, board_width - edge_margin - tp_w/2)
-                tp_y = np.random.uniform(edge_margin + tp_h/2, board_height - edge_margin - tp_h/2)
+                tp_x = rng.uniform(edge_margin + tp_w/2, board_width - edge_margin - tp_w/2)
+                tp_y = rng.uniform(edge_margin + tp_h/2, board_height - edge_margin - tp_h/2)
 
             # Clamp to IC zone (inside edge_margin boundary)
             tp_x = max(edge_margin + tp_w/2, min(board_width - edge_margin - tp_w/2, tp_x))
@@ -1028,25 +1311,201 @@ def place_components_with_perlin_noise(
 
             # Check collision with smaller clearance for test points
             min_spacing = 2.0
-            can_place = True
-            for placed in placed_components:
-                if testpoint.overlaps_with(placed, min_clearance=min_spacing):
-                    can_place = False
-                    break
-
-            if can_place:
+            if not self.placed_index.overlaps(testpoint, min_clearance=min_spacing):
                 return testpoint
 
         return None
 
-    # Place test points
-    testpoint_count = int(params.get('testpoint_count', 15))
-    for _ in range(testpoint_count):
-        tp = try_place_testpoint()
-        if tp:
-            placed_components.append(tp)
 
-    return placed_components
+@dataclass(frozen=True, slots=True)
+class PlacementParams:
+    """
+    Parameters of place_components_with_perlin_noise, resolved once per board.
+
+    Defaults are the good values from testing.
+    """
+
+    seed: Optional[int] = 114
+    scale: float = 343.8
+    octaves: int = 8
+    persistence: float = 0.2055
+    lacunarity: float = 3.276
+    vignette_strength: float = 0.882
+    grid_sizes: tuple = (24.4, 14.6, 13.5, 3.6, 1.5)  # mm
+    large_count: int = 1
+    medium_count: int = 24
+    small_med_count: int = 89
+    small_count: int = 186
+    connector_count: int = 8
+    testpoint_count: int = 15
+    large_spacing: float = 7.8       # mm
+    medium_spacing: float = 2.1      # mm
+    small_med_spacing: float = 1.4   # mm
+    small_spacing: float = 1.0       # mm
+    max_consecutive_failures: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, params: dict) -> "PlacementParams":
+        """Create params from a dictionary; missing keys keep their defaults, unknown keys are ignored."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in params.items() if key in names})
+
+
+def place_components_with_perlin_noise(
+    board_width: float,
+    board_height: float,
+    params: Optional[Union[PlacementParams, Dict]] = None
+) -> List[Component]:
+    """
+    Place components on a PCB using Perlin noise-based placement algorithm.
+
+    Args:
+        board_width: Board width in mm
+        board_height: Board height in mm
+        params: PlacementParams or dictionary of algorithm parameters
+            (uses defaults if None)
+
+    Returns:
+        List of placed Component objects
+    """
+    if params is None:
+        params = PlacementParams()
+    elif not isinstance(params, PlacementParams):
+        params = PlacementParams.from_dict(params)
+
+    # One PCG64 generator per board drives every random choice below; the
+    # noise tables use their own, so the board is reproducible from this seed
+    # without touching NumPy's global RNG state
+    seed = params.seed
+    if seed is not None:
+        seed = int(seed)
+    rng = np.random.default_rng(seed)
+
+    # Generate Perlin noise
+    noise_map = generate_perlin_noise(
+        width=board_width,
+        height=board_height,
+        scale=params.scale,
+        octaves=int(params.octaves),
+        persistence=params.persistence,
+        lacunarity=params.lacunarity,
+        seed=seed,
+        vignette_strength=params.vignette_strength
+    )
+
+    # Create adaptive grid
+    grid_sizes = params.grid_sizes
+    grid_cells = create_adaptive_grid(noise_map, grid_sizes)
+
+    # Categorize cells by size
+    grid_size_1 = grid_sizes[0]
+    grid_size_2 = grid_sizes[1]
+    grid_size_3 = grid_sizes[2]
+    grid_size_4 = grid_sizes[3]
+
+    # Categories hold row indices into grid_cells so per-cell data can be cached
+    cell_w = grid_cells[:, 2]
+    all_cells = np.arange(len(grid_cells))
+    size_1_cells = np.flatnonzero(cell_w >= grid_size_1 - 1.0)
+    size_2_cells = np.flatnonzero((grid_size_2 - 1.0 <= cell_w) & (cell_w < grid_size_1 - 1.0))
+    size_3_cells = np.flatnonzero((grid_size_3 - 0.5 <= cell_w) & (cell_w < grid_size_2 - 1.0))
+    size_4_cells = np.flatnonzero((grid_size_4 - 0.5 <= cell_w) & (cell_w < grid_size_3 - 0.5))
+    size_5_cells = np.flatnonzero(cell_w < grid_size_4 - 0.5)
+
+    placer = _Placer(board_width, board_height, noise_map, grid_cells, rng)
+    place_repeatedly = functools.partial(
+        placer.place_repeatedly, max_failures=params.max_consecutive_failures
+    )
+    try_place_component = placer.try_place_component
+
+    def place_decoupling_caps(comp):
+        """Place decoupling caps around a freshly placed large component."""
+        for cap in placer.place_decoupling_caps_near(comp, count=rng.integers(2, 5)):
+            placer.add_placed(cap)
+
+    # Place large components in Size 1 cells
+    place_repeatedly(
+        int(params.large_count),
+        functools.partial(
+            try_place_component,
+            _LARGE_FOOTPRINTS,
+            size_1_cells,
+            all_cells,
+            grid_spacing=params.large_spacing,
+            comp_type='large',
+            allow_rotation=False
+        ),
+        on_placed=place_decoupling_caps,
+    )
+
+    # Place small components in Size 2 cells (40% of small components)
+    small_in_size2 = int(params.small_count * 0.4)
+    place_repeatedly(
+        small_in_size2,
+        functools.partial(
+            try_place_component,
+            _SMALL_FOOTPRINTS,
+            size_2_cells,
+            all_cells,
+            grid_spacing=params.small_spacing,
+            comp_type='small',
+            allow_rotation=True
+        ),
+    )
+
+    # Place medium components in Size 3 cells
+    place_repeatedly(
+        int(params.medium_count),
+        functools.partial(
+            try_place_component,
+            _MEDIUM_FOOTPRINTS,
+            size_3_cells,
+            all_cells,
+            grid_spacing=params.medium_spacing,
+            comp_type='medium',
+            allow_rotation=True
+        ),
+    )
+
+    # Place small-medium components in Size 4 cells
+    place_repeatedly(
+        int(params.small_med_count),
+        functools.partial(
+            try_place_component,
+            _SMALL_MED_FOOTPRINTS,
+            size_4_cells,
+            all_cells,
+            grid_spacing=params.small_med_spacing,
+            comp_type='small_med',
+            allow_rotation=True
+        ),
+    )
+
+    # Place remaining small components in Size 5 cells (60% of small components)
+    small_in_size5 = int(params.small_count * 0.6)
+    place_repeatedly(
+        small_in_size5,
+        functools.partial(
+            try_place_component,
+            _SMALL_FOOTPRINTS,
+            size_5_cells,
+            all_cells,
+            grid_spacing=params.small_spacing,
+            comp_type='small',
+            allow_rotation=True
+        ),
+    )
+
+    # Place connectors in edge zones only
+    place_repeatedly(
+        int(params.connector_count),
+        functools.partial(placer.try_place_connector, _CONNECTOR_FOOTPRINTS),
+    )
+
+    # Place test points semi-randomly near components (inside IC zone only)
+    place_repeatedly(int(params.testpoint_count), placer.try_place_testpoint)
+
+    return placer.placed_components
 
 
 # ============================================================================
@@ -1064,12 +1523,40 @@ class PerlinPlacer:
         self.config = config
         self.lib = ExpandedComponentLibrary()
 
-        if config.seed is not None:
-            random.seed(config.seed)
-            np.random.seed(config.seed)
-
+        # Seeding happens per board in place_components_with_perlin_noise, so
+        # a seed changed between samples (Pipeline.generate_sample) takes effect
         logger.info(f"Initialized PerlinPlacer with seed={config.seed}")
 
+    def _place_components(self) -> List[Component]:
+        """Run the POC placement algorithm with this placer's config."""
+        params = PlacementParams(
+            seed=self.config.seed,
+            scale=self.config.scale,
+            octaves=self.config.octaves,
+            persistence=self.config.persistence,
+            lacunarity=self.config.lacunarity,
+            vignette_strength=self.config.vignette_strength,
+            grid_sizes=self.config.grid_sizes,
+            large_count=self.config.large_count,
+            medium_count=self.config.medium_count,
+            small_med_count=self.config.small_med_count,
+            small_count=self.config.small_count,
+            connector_count=self.config.connector_count,
+            testpoint_count=self.config.testpoint_count,
+            large_spacing=self.config.large_spacing,
+            medium_spacing=self.config.medium_spacing,
+            small_med_spacing=self.config.small_med_spacing,
+            small_spacing=self.config.small_spacing,
+            max_consecutive_failures=self.config.max_consecutive_failures,
+        )
+
+        # Call POC placement function directly (now in this file)
+        return place_components_with_perlin_noise(
+            board_width=self.config.board_width,
+            board_height=self.config.board_height,
+            params=params
+        )
+
     def generate_placements(self) -> List[ComponentPlacement]:
         """
         Generate component placements using exact POC algorithm.
@@ -1078,32 +1565,7 @@ class PerlinPlacer:
         """
         logger.info("Generating component placements (POC algorithm)...")
 
-        params = {
-            'seed': self.config.seed,
-            'scale': self.config.scale,
-            'octaves': self.config.octaves,
-            'persistence': self.config.persistence,
-            'lacunarity': self.config.lacunarity,
-            'vignette_strength': self.config.vignette_strength,
-            'grid_sizes': self.config.grid_sizes,
-            'large_count': self.config.large_count,
-            'medium_count': self.config.medium_count,
-            'small_med_count': self.config.small_med_count,
-            'small_count': self.config.small_count,
-            'connector_count': self.config.connector_count,
-            'testpoint_count': self.config.testpoint_count,
-            'large_spacing': self.config.large_spacing,
-            'medium_spacing': self.config.medium_spacing,
-            'small_med_spacing': self.config.small_med_spacing,
-            'small_spacing': self.config.small_spacing,
-        }
-
-        # Call POC placement function directly (now in this file)
-        poc_components = place_components_with_perlin_noise(
-            board_width=self.config.board_width,
-            board_height=self.config.board_height,
-            params=params
-        )
+        poc_components = self._place_components()
 
         # Assign footprints from library to each component
         for comp in poc_components:
@@ -1132,3 +1594,61 @@ class PerlinPlacer:
 
         logger.info(f"Generated {len(placements)} component placements")
         return placements
+
+    def generate_placements_array(self) -> PlacementArrays:
+        """
+        Generate component placements as compact parallel arrays.
+
+        Same placements as generate_placements, without one object per
+        component: positions are float32 mm, rotation is uint16 degrees, and
+        size_category / component_type are indices into SIZE_CATEGORIES and
+        FOOTPRINT_NAMES.
+
+        Returns:
+            PlacementArrays with one entry per placed component
+        """
+        poc_components = self._place_components()
+        count = len(poc_components)
+
+        x = np.empty(count, dtype=np.float32)
+        y = np.empty(count, dtype=np.float32)
+        rotation = np.empty(count, dtype=np.uint16)
+        size_category = np.empty(count, dtype=np.uint8)
+        component_type = np.empty(count, dtype=np.uint16)
+
+        size_codes = {name: i for i, name in enumerate(SIZE_CATEGORIES)}
+        type_codes = {name: i for i, name in enumerate(FOOTPRINT_NAMES)}
+        small = size_codes['small']
+
+        for i, comp in enumerate(poc_components):
+            x[i], y[i] = comp.location
+            rotation[i] = comp.rotation
+            size_category[i] = size_codes.get(comp.comp_type, small)
+            component_type[i] = type_codes[comp.footprint_name]
+
+        logger.info(f"Generated {count} component placements")
+        return PlacementArrays(x, y, rotation, size_category, component_type)
+
+    def generate_many(
+        self, seeds: Iterable[int], max_workers: Optional[int] = None
+    ) -> List[List[ComponentPlacement]]:
+        """
+        Generate placements for several boards in a process pool.
+
+        Boards are independent and reproducible from their seed, so each one
+        is placed in a worker process with a copy of this placer's config.
+
+        Args:
+            seeds: One seed per board
+            max_workers: Number of worker processes (CPU count if None)
+
+        Returns:
+            Placements for each seed, in the order of seeds
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(functools.partial(_generate_for_seed, self.config), seeds))
+
+
+def _generate_for_seed(config: PlacementConfig, seed: int) -> List[ComponentPlacement]:
+    """Process-pool task for PerlinPlacer.generate_many."""
+    return PerlinPlacer(replace(config, seed=seed)).generate_placements()
@@ -4,41 +4,235 @@ BlenderProc rendering with material-based segmentation.
 Direct port from POC: src/bproc_renderer.py (working version)
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Dict
+from types import MappingProxyType
+from typing import Any, List, Dict, Mapping, Optional, Sequence, Tuple
+import functools
+import json
 import logging
+import os
+import re
+import subprocess
 import sys
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Prefix of the line scripts/blenderproc_render_script.py reports results on
+RESULT_PREFIX = "@@PCB_RENDER@@"
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RenderConfig:
     """Configuration for rendering."""
 
-    cameras: List[Dict]
-    lighting: Dict
-    background: List[float]
+    cameras: Tuple[Mapping, ...]
+    lighting: Mapping
+    background: Tuple[float, ...]
     resolution: int
     render_samples: int = 128
     denoise: bool = True
     use_gpu: bool = True
+    fast_bvh: bool = False
+    store_float_depth: bool = False
+    hdf5_compression: Optional[str] = "gzip"
+    hdf5_compression_level: Optional[int] = 4
 
     @classmethod
     def from_dict(cls, config: dict) -> "RenderConfig":
         """Create config from dictionary (loaded from YAML)."""
         return cls(
-            cameras=config["cameras"],
-            lighting=config["lighting"],
-            background=config["background"]["color"],
+            cameras=_freeze(config["cameras"]),
+            lighting=_freeze(config["lighting"]),
+            background=_freeze(config["background"]["color"]),
             resolution=config["resolution"],
             render_samples=config["render"].get("samples", 128),
             denoise=config["render"].get("denoise", True),
             use_gpu=config["render"].get("use_gpu", True),
+            fast_bvh=config["render"].get("fast_bvh", False),
+            store_float_depth=config.get("depth", {}).get("store_float", False),
+            hdf5_compression=config.get("output", {}).get("compression", "gzip"),
+            hdf5_compression_level=config.get("output", {}).get("compression_level", 4),
         )
 
 
+def normalize_depth_u8(depth: np.ndarray) -> np.ndarray:
+    """Min-max normalize a depth map to uint8 for visualization."""
+    depth_min = depth.min()
+    depth_range = depth.max() - depth_min
+    if depth_range == 0:
+        return np.zeros(depth.shape, dtype=np.uint8)
+    return ((depth - depth_min) / depth_range * 255).astype(np.uint8)
+
+
+# Keyword tests used by _classify_material, each a single substring search
+_METAL_MAT_RE = re.compile(r'solder|copper|pad|metal|tin')
+_METAL_NODE_RE = re.compile(r'exposed_copper|solder')
+_NONMETAL_NODE_RE = re.compile(r'solder_mask|silkscreen|base_material')
+_NONMETAL_GROUP_RE = re.compile(r'plastic|ceramic')
+
+
+def _material_node_descriptors(mat) -> Optional[Tuple]:
+    """
+    Hashable summary of the shader node fields _classify_material looks at.
+
+    Returns:
+        One (node_name_lower, is_metal_base, group_name_lower) tuple per node,
+        or None if the material does not use nodes
+    """
+    if not (mat.use_nodes and mat.node_tree):
+        return None
+
+    descriptors = []
+    for node in mat.node_tree.nodes:
+        node_name_lower = node.name.lower()
+        is_metal_base = False
+        group_name_lower = None
+        if 'mat4cad' in node_name_lower:
+            # mat_base 2 = metal surface
+            if 'mat_base' in node.keys():
+                is_metal_base = node['mat_base'] == 2
+            if hasattr(node, 'node_tree') and node.node_tree:
+                group_name_lower = node.node_tree.name.lower()
+        descriptors.append((node_name_lower, is_metal_base, group_name_lower))
+    return tuple(descriptors)
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_material(mat_name_lower: str, node_descriptors: Optional[Tuple]) -> bool:
+    """
+    Decide whether a material is metal (probable, category 1).
+
+    Args:
+        mat_name_lower: Lower-cased material name
+        node_descriptors: Output of _material_node_descriptors
+
+    Returns:
+        True for metal materials, False otherwise
+    """
+    is_metal = False
+
+    # Check material name for metal keywords
+    if _METAL_MAT_RE.search(mat_name_lower) is not None:
+        is_metal = True
+
+    # Check shader nodes for metal surface indicators
+    if node_descriptors is not None:
+        has_metal_node = False
+        has_nonmetal_node = False
+
+        for node_name_lower, is_metal_base, group_name_lower in node_descriptors:
+            # Check Mat4cad BSDF nodes for component surface types
+            if 'mat4cad' in node_name_lower:
+                # Check the mat_base property (2 = metal surface)
+                if is_metal_base:
+                    has_metal_node = True
+                    break
+                # Also check the node group name
+                if group_name_lower is not None:
+                    if 'metal' in group_name_lower:
+                        has_metal_node = True
+                        break
+                    elif _NONMETAL_GROUP_RE.search(group_name_lower) is not None:
+                        has_nonmetal_node = True
+                        break
+
+            # Check for PCB-specific metal nodes; metal wins over any
+            # non-metal node, so the rest need not be scanned
+            if _METAL_NODE_RE.search(node_name_lower) is not None:
+                has_metal_node = True
+                break
+            # Check for PCB-specific non-metal nodes
+            if _NONMETAL_NODE_RE.search(node_name_lower) is not None:
+                has_nonmetal_node = True
+
+        # Prioritize metal detection
+        if has_metal_node:
+            is_metal = True
+        elif has_nonmetal_node:
+            is_metal = False
+
+    return is_metal
+
+
+def _split_object_by_material(obj, bpy, bmesh) -> list:
+    """
+    Split a mesh object into one object per used material.
+
+    Equivalent of bpy.ops.mesh.separate(type='MATERIAL') done on mesh data:
+    the original object keeps the first material's faces and every other
+    material gets a copy of the object (same transform, parent and custom
+    properties) with its own single-material mesh.
+
+    Returns:
+        The newly created part objects (empty if the object was not split)
+    """
+    mesh = obj.data
+
+    # Read every face's material index in one bulk call; bmesh keeps faces
+    # in the same order, so the array also indexes the bmesh faces below
+    material_indices = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('material_index', material_indices)
+    used_indices = np.unique(material_indices).tolist()
+    if len(used_indices) < 2:
+        return []
+
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+
+    slot_materials = [slot.material for slot in obj.material_slots]
+    new_objs = []
+
+    for i, material_index in enumerate(used_indices):
+        part = bm.copy()
+        part.faces.ensure_lookup_table()
+        part_faces = part.faces
+        bmesh.ops.delete(
+            part,
+            geom=[part_faces[j] for j in np.flatnonzero(material_indices != material_index).tolist()],
+            context='FACES',
+        )
+
+        part_mesh = bpy.data.meshes.new(f"{mesh.name}.{material_index:03d}")
+        part.to_mesh(part_mesh)
+        part.free()
+        part_mesh.polygons.foreach_set(
+            'material_index', np.zeros(len(part_mesh.polygons), dtype=np.int32)
+        )
+        if material_index < len(slot_materials):
+            part_mesh.materials.append(slot_materials[material_index])
+
+        if i == 0:
+            part_obj = obj
+        else:
+            part_obj = obj.copy()
+            for collection in obj.users_collection:
+                collection.objects.link(part_obj)
+            new_objs.append(part_obj)
+        part_obj.data = part_mesh
+        # Copies keep the source's slot link modes; an object-linked slot 0
+        # would show the source's slot-0 material instead of the part's
+        if part_obj.material_slots:
+            part_obj.material_slots[0].link = 'DATA'
+
+    bm.free()
+    if mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
+    return new_objs
+
+
 class BProcRenderer:
     """
     BlenderProc renderer with segmentation.
@@ -49,6 +243,11 @@ class BProcRenderer:
     def __init__(self, config: RenderConfig):
         """Initialize renderer."""
         self.config = config
+        # Camera world matrices keyed by (position, rotation); fixed camera
+        # poses recur for every scene rendered in a session
+        self._camera_matrices = {}
+        # Background HDF5 writes still in flight, by output path
+        self._pending_writes = {}
 
     def render(self, blend_path: Path, output_dir: Path) -> Path:
         """
@@ -56,14 +255,68 @@ class BProcRenderer:
 
         Exact implementation from POC src/bproc_renderer.py
         """
-        try:
-            import blenderproc as bproc
-            import bpy
-        except ImportError:
-            raise RuntimeError("blenderproc and bpy required - must run in Blender environment")
+        bproc, bpy = _import_blenderproc()
 
         logger.info(f"Rendering {blend_path.name}...")
+        self._init_session(bproc, bpy)
+        return self._render_scene(bproc, bpy, blend_path, output_dir)
+
+    def render_batch(self, blend_paths: Sequence[Path], output_dir: Path) -> List[Optional[Path]]:
+        """
+        Render several .blend files in one BlenderProc session.
 
+        bproc.init(), the pcb2blender material registration and the render
+        output settings are done once; the scene is cleaned up between files
+        instead of starting a new Blender for each one.
+
+        Args:
+            blend_paths: .blend files to render, in order
+            output_dir: Output directory; each file's HDF5 output goes into
+                its own .scene<i> subdirectory (reused by later batches)
+
+        Returns:
+            HDF5 path for each input file, or None where that render failed
+        """
+        bproc, bpy = _import_blenderproc()
+
+        logger.info(f"Rendering batch of {len(blend_paths)} files...")
+        self._init_session(bproc, bpy)
+
+        output_paths = []
+        with ThreadPoolExecutor(max_workers=1) as io_pool:
+            for i, blend_path in enumerate(blend_paths):
+                logger.info(f"Rendering {blend_path.name} ({i+1}/{len(blend_paths)})...")
+                if i > 0:
+                    # Drop the previous board's objects, materials, lights,
+                    # camera poses and keyframes; render settings are kept
+                    bproc.clean_up(clean_up_camera=True)
+
+                # Each scene overwrites <frame>.hdf5, so scenes of one batch
+                # get their own subdirectory until the caller collects them
+                scene_dir = output_dir / f".scene{i}"
+                try:
+                    output_paths.append(
+                        self._render_scene(bproc, bpy, blend_path, scene_dir, io_pool=io_pool)
+                    )
+                except Exception as e:
+                    logger.error(f"Render failed for {blend_path}: {e}", exc_info=True)
+                    output_paths.append(None)
+
+            # Wait for the background HDF5 writes
+            for i, output_path in enumerate(output_paths):
+                future = self._pending_writes.pop(output_path, None)
+                if future is None:
+                    continue
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"HDF5 write failed for {output_path}: {e}", exc_info=True)
+                    output_paths[i] = None
+
+        return output_paths
+
+    def _init_session(self, bproc, bpy):
+        """Initialize BlenderProc and the per-session render settings."""
         # Initialize BlenderProc
         bproc.init()
 
@@ -75,139 +328,148 @@ class BProcRenderer:
         try:
             from pcb2blender_importer import materials
             materials.register()
-            print("✓ Registered pcb2blender materials")
+            logger.info("Registered pcb2blender materials")
         except Exception as e:
-            print(f"Warning: Could not register pcb2blender materials: {e}")
+            logger.warning(f"Could not register pcb2blender materials: {e}")
+
+        # Camera resolution
+        bproc.camera.set_resolution(self.config.resolution, self.config.resolution)
+
+        # Configure GPU rendering if enabled
+        if self.config.use_gpu:
+            bproc.renderer.set_render_devices(desired_gpu_device_type='OPTIX')
+            bpy.context.scene.cycles.device = 'GPU'
+            logger.info("GPU rendering enabled (OPTIX)")
+
+        # Trade BVH quality for build time: spatial splits make the build
+        # much slower on dense boards, and a dynamic BVH builds fastest
+        if self.config.fast_bvh:
+            bpy.context.scene.cycles.debug_use_spatial_splits = False
+            bpy.context.scene.cycles.debug_bvh_type = 'DYNAMIC_BVH'
+            logger.info("Fast BVH build enabled")
+
+        # Set render samples
+        bproc.renderer.set_max_amount_of_samples(self.config.render_samples)
+        if self.config.denoise:
+            bproc.renderer.enable_normals_output()
+            bpy.context.scene.cycles.use_denoising = True
+            logger.info(f"Denoising enabled with {self.config.render_samples} samples")
+
+        # Enable depth rendering (BlenderProc allows this only once per session)
+        bproc.renderer.enable_depth_output(activate_antialiasing=False)
+
+        # Enable segmentation output
+        bproc.renderer.enable_segmentation_output(
+            map_by=["category_id", "material", "instance", "name"],
+            default_values={'category_id': 0, 'material': None}
+        )
+
+    def _render_scene(
+        self, bproc, bpy, blend_path: Path, output_dir: Path, io_pool: Optional[ThreadPoolExecutor] = None
+    ) -> Path:
+        """
+        Load one .blend file into the initialized session, render it and write HDF5.
 
+        With io_pool, the HDF5 write is submitted to it and recorded in
+        _pending_writes instead of blocking; the returned path is where the
+        file will be once that write finishes.
+        """
         # Load the objects into the scene
         objs = bproc.loader.load_blend(str(blend_path))
-        print(f"Loaded {len(objs)} objects")
+        logger.debug(f"Loaded {len(objs)} objects")
 
         # === EXACT POC SEGMENTATION LOGIC ===
-        print("\nAssigning segmentation category IDs...")
+        logger.debug("Assigning segmentation category IDs...")
         stats = {'metal_probable': 0, 'non_metal': 0}
 
-        # First, assign category IDs to materials
+        # First, assign category IDs to materials. The same materials recur
+        # across boards, so classification is cached on their node fingerprint
+        metal_names = []
         for mat in bpy.data.materials:
-            mat_name_lower = mat.name.lower()
-            is_metal = False
-
-            # Check material name for metal keywords
-            if any(keyword in mat_name_lower for keyword in ['solder', 'copper', 'pad', 'metal', 'tin']):
-                is_metal = True
-
-            # Check shader nodes for metal surface indicators
-            if mat.use_nodes and mat.node_tree:
-                has_metal_node = False
-                has_nonmetal_node = False
-
-                for node in mat.node_tree.nodes:
-                    node_name_lower = node.name.lower()
-
-                    # Check Mat4cad BSDF nodes for component surface types
-                    if 'mat4cad' in node_name_lower:
-                        # Check the mat_base property (2 = metal surface)
-                        if 'mat_base' in node.keys():
-                            mat_base_val = node['mat_base']
-                            if mat_base_val == 2:
-                                has_metal_node = True
-                                break
-                        # Also check the node group name
-                        if hasattr(node, 'node_tree') and node.node_tree:
-                            group_name_lower = node.node_tree.name.lower()
-                            if 'metal' in group_name_lower:
-                                has_metal_node = True
-                                break
-                            elif 'plastic' in group_name_lower or 'ceramic' in group_name_lower:
-                                has_nonmetal_node = True
-                                break
-
-                    # Check for PCB-specific metal nodes
-                    if any(keyword in node_name_lower for keyword in ['exposed_copper', 'solder']):
-                        has_metal_node = True
-                    # Check for PCB-specific non-metal nodes
-                    if any(keyword in node_name_lower for keyword in ['solder_mask', 'silkscreen', 'base_material']):
-                        has_nonmetal_node = True
+            # Stock grease-pencil materials and materials nothing uses can
+            # never show up on a rendered mesh - skip the node walk for them
+            if mat.users == 0 or mat.is_grease_pencil:
+                mat['category_id'] = 2
+                continue
 
-                # Prioritize metal detection
-                if has_metal_node:
-                    is_metal = True
-                elif has_nonmetal_node:
-                    is_metal = False
+            is_metal = _classify_material(mat.name.lower(), _material_node_descriptors(mat))
 
             if is_metal:
                 mat['category_id'] = 1  # Probable - metal
-                print(f"  Metal material: {mat.name} -> category 1")
+                metal_names.append(mat.name)
             else:
                 mat['category_id'] = 2  # Non-probable - non-metal
 
+        logger.debug(f"Metal materials (category 1): {', '.join(metal_names)}")
+
         # Split multi-material objects to allow per-material segmentation
-        print("\nSplitting multi-material objects for per-face segmentation...")
-        objects_to_process = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+        import bmesh
+
+        logger.debug("Splitting multi-material objects for per-face segmentation...")
+
+        # Partition the meshes by name once; both passes below reuse it
+        solder_objs = []
+        component_objs = []
+        for obj in bpy.data.objects:
+            if obj.type != 'MESH':
+                continue
+            name = obj.name
+            if name.startswith('SOLDER_'):
+                solder_objs.append(obj)
+            # PCB objects are neither split nor assigned - they use
+            # material-based segmentation
+            elif not name.startswith('PCB_'):
+                component_objs.append(obj)
+
         split_count = 0
         multi_mat_count = 0
+        split_parts = []
 
-        for obj in objects_to_process:
-            # Skip solder joints and PCB
-            if obj.name.startswith('SOLDER_') or obj.name.startswith('PCB_'):
+        for obj in component_objs:
+            # Check if object has multiple UNIQUE materials; most have a
+            # single slot, so only build the name set when it can matter
+            slot_mats = [slot.material for slot in obj.material_slots if slot.material]
+            if len(slot_mats) < 2:
                 continue
 
-            # Check if object has multiple UNIQUE materials
-            unique_mats = set()
-            for slot in obj.material_slots:
-                if slot.material:
-                    unique_mats.add(slot.material.name)
-
-            if len(unique_mats) > 1:
+            if len({mat.name for mat in slot_mats}) > 1:
                 multi_mat_count += 1
 
-                # Select only this object
-                bpy.ops.object.select_all(action='DESELECT')
-                obj.select_set(True)
-                bpy.context.view_layer.objects.active = obj
-
-                # Enter edit mode and separate by material
-                bpy.ops.object.mode_set(mode='EDIT')
-                bpy.ops.mesh.select_all(action='SELECT')
-                bpy.ops.mesh.separate(type='MATERIAL')
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-                split_count += 1
-
-        print(f"\nFound {multi_mat_count} multi-material objects, split {split_count}\n")
-
-        # Then assign to objects based on their materials or object name
-        for obj in bpy.data.objects:
-            if obj.type != 'MESH':
-                continue
-
-            # Solder joints are always metal (probable)
-            if obj.name.startswith('SOLDER_'):
-                obj['category_id'] = 1
+                # Separate by material through bmesh, without mode switches
+                # or selection changes (each bpy.ops call updates the depsgraph)
+                parts = _split_object_by_material(obj, bpy, bmesh)
+                if parts:
+                    split_parts.extend(parts)
+                    split_count += 1
+
+        if split_count:
+            component_objs.extend(split_parts)
+            bpy.context.view_layer.update()
+
+        logger.debug(f"Found {multi_mat_count} multi-material objects, split {split_count}")
+
+        # Then assign to objects based on their materials or object name.
+        # Solder joints are always metal (probable)
+        for obj in solder_objs:
+            obj['category_id'] = 1
+        stats['metal_probable'] += len(solder_objs)
+
+        # For component objects, assign based on their single material
+        # (non-metal if it has none or it was not classified)
+        for obj in component_objs:
+            slots = obj.material_slots
+            first_mat = slots[0].material if slots else None
+            category_id = first_mat.get('category_id', 2) if first_mat else 2
+            obj['category_id'] = category_id
+            if category_id == 1:
                 stats['metal_probable'] += 1
-            # Skip PCB objects - let them use material-based segmentation
-            elif obj.name.startswith('PCB_'):
-                pass
-            # For component objects, assign based on their single material
             else:
-                if obj.material_slots and len(obj.material_slots) > 0:
-                    first_mat = obj.material_slots[0].material
-                    if first_mat and 'category_id' in first_mat:
-                        obj['category_id'] = first_mat['category_id']
-                        if first_mat['category_id'] == 1:
-                            stats['metal_probable'] += 1
-                        else:
-                            stats['non_metal'] += 1
-                    else:
-                        obj['category_id'] = 2
-                        stats['non_metal'] += 1
-                else:
-                    obj['category_id'] = 2
-                    stats['non_metal'] += 1
+                stats['non_metal'] += 1
 
-        print(f"\n✓ Assigned category IDs:")
-        print(f"  Metal/Probable (cat 1):         {stats['metal_probable']}")
-        print(f"  Non-metal/Non-probable (cat 2): {stats['non_metal']}\n")
+        logger.info(
+            f"Assigned category IDs: {stats['metal_probable']} metal/probable (cat 1), "
+            f"{stats['non_metal']} non-metal (cat 2)"
+        )
 
         # Set background
         bproc.renderer.set_world_background(self.config.background)
@@ -226,49 +488,181 @@ class BProcRenderer:
             fill_light.set_energy(fill_config["energy"])
 
         # Setup cameras from config
-        bproc.camera.set_resolution(self.config.resolution, self.config.resolution)
         for camera in self.config.cameras:
             position = camera["position"]
             rotation = camera["rotation"]
-            matrix_world = bproc.math.build_transformation_mat(position, rotation)
+            key = (tuple(position), tuple(rotation))
+            matrix_world = self._camera_matrices.get(key)
+            if matrix_world is None:
+                matrix_world = bproc.math.build_transformation_mat(position, rotation)
+                self._camera_matrices[key] = matrix_world
             bproc.camera.add_camera_pose(matrix_world)
 
-        # Configure GPU rendering if enabled
-        if self.config.use_gpu:
-            bproc.renderer.set_render_devices(desired_gpu_device_type='OPTIX')
-            bpy.context.scene.cycles.device = 'GPU'
-            print("GPU rendering enabled (OPTIX)")
-
-        # Set render samples
-        bproc.renderer.set_max_amount_of_samples(self.config.render_samples)
-        if self.config.denoise:
-            bproc.renderer.enable_normals_output()
-            bpy.context.scene.cycles.use_denoising = True
-            print(f"Denoising enabled with {self.config.render_samples} samples")
-
-        # Enable depth rendering
-        bproc.renderer.enable_depth_output(activate_antialiasing=False)
-
-        # Enable segmentation output
-        bproc.renderer.enable_segmentation_output(
-            map_by=["category_id", "material", "instance", "name"],
-            default_values={'category_id': 0, 'material': None}
-        )
-
         # Render
-        print("\nRendering...")
+        logger.debug("Rendering...")
         data = bproc.renderer.render()
 
-        # Save to HDF5
+        # Normalize depth once here so converters can read uint8 directly
+        data["depth_u8"] = [normalize_depth_u8(depth) for depth in data["depth"]]
+        if not self.config.store_float_depth:
+            del data["depth"]
+
+        # Save to HDF5, overwriting like write_hdf5 without append: files are
+        # named <frame>.hdf5, so the written file is known without listing
+        # the directory
         output_dir.mkdir(parents=True, exist_ok=True)
-        bproc.writer.write_hdf5(str(output_dir), data)
+        scene = bpy.context.scene
+        output_path = output_dir / f"{scene.frame_end - 1}.hdf5"
 
-        # Find the output file
-        output_files = list(output_dir.glob("*.hdf5"))
-        if output_files:
-            output_path = output_files[-1]
+        write_args = (
+            output_dir, data, scene.frame_start, scene.frame_end,
+            self.config.hdf5_compression, self.config.hdf5_compression_level,
+        )
+        if io_pool is None:
+            _write_hdf5_frames(*write_args)
         else:
-            output_path = output_dir / f"{blend_path.stem}.hdf5"
+            # Write in the background while the next scene is loaded
+            self._pending_writes[output_path] = io_pool.submit(_write_hdf5_frames, *write_args)
 
         logger.info(f"Render complete: {output_path}")
         return output_path
+
+
+def _write_hdf5_frames(
+    output_dir: Path,
+    data: dict,
+    frame_start: int,
+    frame_end: int,
+    compression: Optional[str] = "gzip",
+    compression_level: Optional[int] = 4,
+    bproc_version: Optional[str] = None,
+):
+    """
+    Write render output in the layout of bproc.writer.write_hdf5.
+
+    One <frame>.hdf5 file per frame (existing files are overwritten), with one dataset per
+    output key plus blender_proc_version. Only h5py and NumPy are used (no
+    bpy), so this is safe to run on a background thread while Blender works
+    on the next scene.
+
+    Args:
+        output_dir: Output directory
+        data: Output of bproc.renderer.render() (lists indexed by frame)
+        frame_start: First frame to write
+        frame_end: End of the frame range (exclusive)
+        compression: h5py compression filter for image arrays ("gzip", "lzf"
+            or None for uncompressed)
+        compression_level: gzip level (0-9); ignored by other filters
+        bproc_version: Value of the blender_proc_version dataset (the running
+            BlenderProc's __version__ if None)
+    """
+    import h5py
+
+    if bproc_version is None:
+        from blenderproc.version import __version__ as bproc_version
+
+    if compression in (None, "none"):
+        compression = None
+        compression_level = None
+    elif compression != "gzip":
+        compression_level = None
+
+    # Mirrors WriterUtility.write_hdf5 / _write_to_hdf_file from BlenderProc
+    # 2.8 (the release for Blender 4.2): data lists are indexed from
+    # frame_start, list-of-dict entries become JSON strings, arrays are
+    # compressed and the BlenderProc version is stored with every frame
+    for frame in range(frame_start, frame_end):
+        with h5py.File(output_dir / f"{frame}.hdf5", "w") as f:
+            adjusted_frame = frame - frame_start
+            for key, data_block in data.items():
+                if adjusted_frame >= len(data_block):
+                    continue
+                value = data_block[adjusted_frame]
+
+                # Attribute maps are lists of dicts - stored as a JSON string
+                if isinstance(value, list) and value and isinstance(value[0], dict):
+                    value = np.bytes_(json.dumps(value))
+
+                if isinstance(value, np.ndarray) and value.ndim > 0:
+                    f.create_dataset(
+                        key, data=value, compression=compression, compression_opts=compression_level
+                    )
+                else:
+                    f.create_dataset(key, data=value)
+
+            f.create_dataset("blender_proc_version", data=np.bytes_(bproc_version))
+
+
+def _import_blenderproc():
+    """Import blenderproc and bpy, which only exist inside Blender's Python."""
+    try:
+        import blenderproc as bproc
+        import bpy
+    except ImportError:
+        raise RuntimeError("blenderproc and bpy required - must run in Blender environment")
+    return bproc, bpy
+
+
+def run_render_process(
+    blend_paths: Sequence[Path],
+    output_dir: Path,
+    config_dir: Optional[Path] = None,
+    gpu: Optional[int] = None,
+) -> Dict[str, Optional[Path]]:
+    """
+    Render .blend files in one `blenderproc run` process.
+
+    The render script is given the whole list (one BlenderProc startup) and
+    reports which HDF5 file each .blend produced on a RESULT_PREFIX line, so
+    the output is never located by listing the directory.
+
+    Args:
+        blend_paths: .blend files to render
+        output_dir: Directory the render script writes into
+        config_dir: Config directory (the repo's config/ if None)
+        gpu: Restrict the process to this GPU index (via CUDA_VISIBLE_DEVICES);
+            None uses the default device selection
+
+    Returns:
+        Dict mapping each .blend path (as str) to its HDF5 file, or None where
+        that render failed
+
+    Raises:
+        RuntimeError: If the process exited without reporting results
+    """
+    repo_dir = Path(__file__).parent.parent.parent
+    render_script = repo_dir / "scripts" / "blenderproc_render_script.py"
+    if config_dir is None:
+        config_dir = repo_dir / "config"
+
+    env = None
+    if gpu is not None:
+        env = dict(os.environ, CUDA_VISIBLE_DEVICES=str(gpu))
+
+    cmd = [
+        "blenderproc", "run",
+        str(render_script),
+        *(str(blend_path) for blend_path in blend_paths),
+        str(output_dir),
+        "--config-dir", str(config_dir),
+    ]
+
+    logger.debug(f"Running: {' '.join(cmd)}")
+
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+
+    # The script reports per-file results on one prefixed line, even when
+    # some of the renders failed (returncode 2)
+    rendered = None
+    for line in result.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            rendered = json.loads(line[len(RESULT_PREFIX):])
+
+    if rendered is None:
+        logger.error(f"BlenderProc render failed: {result.stderr}")
+        raise RuntimeError(f"BlenderProc render failed: {result.stderr}")
+
+    return {
+        str(blend_path): Path(rendered[str(blend_path)]) if rendered.get(str(blend_path)) else None
+        for blend_path in blend_paths
+    }
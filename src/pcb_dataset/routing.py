@@ -5,7 +5,10 @@ Ported from POC: src/routing.py
 Generates procedural/random routing for synthetic PCB datasets.
 """
 
+import bisect
 import logging
+import math
+import random
 from typing import List, Tuple, Optional, Dict
 import numpy as np
 
@@ -18,6 +21,10 @@ from pcb_dataset.placement import ComponentPlacement
 
 logger = logging.getLogger(__name__)
 
+# Signal track widths (mm) and their cumulative probabilities (0.5, 0.3, 0.2)
+_SIGNAL_TRACK_WIDTHS = (0.2, 0.25, 0.3)
+_SIGNAL_TRACK_WIDTH_CDF = tuple(np.cumsum([0.5, 0.3, 0.2]).tolist())
+
 
 class Net:
     """Represents an electrical net connecting multiple component pads."""
@@ -39,7 +46,8 @@ class Net:
 
 def generate_random_netlists(
     placements: List[ComponentPlacement],
-    params: Optional[Dict] = None
+    params: Optional[Dict] = None,
+    rng: Optional[random.Random] = None
 ) -> List[Net]:
     """
     Generate random electrical netlists for components.
@@ -48,12 +56,15 @@ def generate_random_netlists(
     Args:
         placements: List of ComponentPlacement objects
         params: Routing parameters
+        rng: Random number generator (module-level random if None)
 
     Returns:
         List of Net objects with connected pads
     """
     if params is None:
         params = {}
+    if rng is None:
+        rng = random
 
     nets = []
     net_counter = 1
@@ -68,7 +79,7 @@ def generate_random_netlists(
 
     # Connect power to ~40% of components (ICs and capacitors)
     for i in range(num_components):
-        if np.random.random() < 0.4:
+        if rng.random() < 0.4:
             power_net.add_pad(i, 0)  # Pin 0 = VCC
             ground_net.add_pad(i, 1)  # Pin 1 = GND
 
@@ -77,58 +88,70 @@ def generate_random_netlists(
 
     # Create signal nets by connecting nearby components
     max_signal_nets = params.get('max_signal_nets', 30)
-    used_pins = set()
+    # Flat used-pin flags, 8 pins per component (byte i * 8 + pin)
+    used_pins = bytearray(num_components * 8)
+
+    # Component centers, for one vectorized distance computation per net
+    xs = np.array([placement.x for placement in placements], dtype=float)
+    ys = np.array([placement.y for placement in placements], dtype=float)
 
     for _ in range(max_signal_nets):
         # Pick random source component
-        source_idx = np.random.randint(0, num_components)
+        source_idx = rng.randrange(0, num_components)
         source_placement = placements[source_idx]
 
         # Skip pins 0,1 (reserved for power)
-        source_pin = np.random.randint(2, 8)
+        source_pin = rng.randrange(2, 8)
 
-        if (source_idx, source_pin) in used_pins:
+        if used_pins[source_idx * 8 + source_pin]:
             continue
 
         net = Net(f'NET_{net_counter}', 'signal')
         net_counter += 1
 
         net.add_pad(source_idx, source_pin)
-        used_pins.add((source_idx, source_pin))
+        used_pins[source_idx * 8 + source_pin] = 1
 
         # Find nearby component to connect
         sx, sy = source_placement.x, source_placement.y
 
-        # Calculate distances
+        # Calculate distances; only the 5 nearest components with a free pin
+        # can be picked, so walk them in (stable) distance order
+        distances = np.sqrt((sx - xs)**2 + (sy - ys)**2)
         candidates = []
-        for target_idx in range(num_components):
+        for target_idx in np.argsort(distances, kind='stable').tolist():
             if target_idx == source_idx:
                 continue
 
-            target_placement = placements[target_idx]
-            tx, ty = target_placement.x, target_placement.y
-            dist = np.sqrt((sx - tx)**2 + (sy - ty)**2)
+            # Find unused pin (first free one of pins 2-7)
+            base = target_idx * 8
+            free = used_pins.find(0, base + 2, base + 8)
+            if free >= 0:
+                candidates.append((target_idx, free - base))
 
-            # Find unused pin
-            for target_pin in range(2, 8):
-                if (target_idx, target_pin) not in used_pins:
-                    candidates.append((dist, target_idx, target_pin))
-                    break
+            if len(candidates) == 5:
+                break
 
         if candidates:
-            # Sort by distance and pick from nearest
-            candidates.sort(key=lambda x: x[0])
-            choice_idx = min(np.random.randint(0, 5), len(candidates) - 1)
-            _, target_idx, target_pin = candidates[choice_idx]
+            # Pick from nearest
+            choice_idx = min(rng.randrange(0, 5), len(candidates) - 1)
+            target_idx, target_pin = candidates[choice_idx]
 
             net.add_pad(target_idx, target_pin)
-            used_pins.add((target_idx, target_pin))
+            used_pins[target_idx * 8 + target_pin] = 1
 
             nets.append(net)
 
     return nets
 
 
+# Unit directions for pads distributed around the perimeter (pad_index / 8 turns)
+_PAD_DIRECTIONS = tuple(
+    (math.cos(angle), math.sin(angle))
+    for angle in ((i / 8) * 2 * math.pi for i in range(8))
+)
+
+
 def get_component_pad_position(
     placement: ComponentPlacement,
     pad_index: int = 0
@@ -149,7 +172,7 @@ def get_component_pad_position(
     w, h = 3.0, 3.0
 
     # Swap if rotated 90/270
-    if placement.rotation in [90, 270]:
+    if placement.rotation in (90, 270):
         w, h = h, w
 
     # Distribute pads around perimeter (simplified)
@@ -163,15 +186,20 @@ def get_component_pad_position(
         return (cx, cy + h/2)  # Bottom
     else:
         # For additional pins, distribute evenly
-        angle = (pad_index / 8) * 2 * np.pi
+        if pad_index < 8:
+            cos_a, sin_a = _PAD_DIRECTIONS[pad_index]
+        else:
+            angle = (pad_index / 8) * 2 * math.pi
+            cos_a, sin_a = math.cos(angle), math.sin(angle)
         radius = max(w, h) / 2
-        return (cx + radius * np.cos(angle), cy + radius * np.sin(angle))
+        return (cx + radius * cos_a, cy + radius * sin_a)
 
 
 def route_dogleg(
     start: Tuple[float, float],
     end: Tuple[float, float],
-    horizontal_first: bool = None
+    horizontal_first: bool = None,
+    rng: Optional[random.Random] = None
 ) -> List[Tuple[float, float]]:
     """
     Create a 2-segment Manhattan route.
@@ -180,12 +208,15 @@ def route_dogleg(
         start: (x, y) start position in mm
         end: (x, y) end position in mm
         horizontal_first: If True, go horizontal first
+        rng: Random number generator (module-level random if None)
 
     Returns:
         List of waypoints
     """
+    if rng is None:
+        rng = random
     if horizontal_first is None:
-        horizontal_first = np.random.random() < 0.5
+        horizontal_first = rng.random() < 0.5
 
     start_x, start_y = start
     end_x, end_y = end
@@ -201,7 +232,8 @@ def route_dogleg(
 def route_manhattan(
     start: Tuple[float, float],
     end: Tuple[float, float],
-    segments: int = None
+    segments: int = None,
+    rng: Optional[random.Random] = None
 ) -> List[Tuple[float, float]]:
     """
     Create a multi-segment Manhattan route.
@@ -210,33 +242,44 @@ def route_manhattan(
         start: (x, y) start position in mm
         end: (x, y) end position in mm
         segments: Number of segments
+        rng: Random number generator (module-level random if None)
 
     Returns:
         List of waypoints
     """
+    if rng is None:
+        rng = random
     if segments is None:
-        segments = np.random.randint(2, 5)
+        segments = rng.randrange(2, 5)
 
     start_x, start_y = start
     end_x, end_y = end
 
+    # Loop invariants: span, jitter scale and clamp bounds per axis
+    span_x = end_x - start_x
+    span_y = end_y - start_y
+    jitter_x = span_x * 0.4
+    jitter_y = span_y * 0.4
+    lo_x, hi_x = min(start_x, end_x), max(start_x, end_x)
+    lo_y, hi_y = min(start_y, end_y), max(start_y, end_y)
+
     waypoints = [start]
     current_x, current_y = start_x, start_y
-    horizontal = np.random.random() < 0.5
+    horizontal = rng.random() < 0.5
 
     for i in range(segments - 1):
         progress = (i + 1) / segments
 
         if horizontal:
-            target_x = start_x + (end_x - start_x) * progress
-            variation = (end_x - start_x) * 0.4 * (np.random.random() - 0.5)
-            target_x = max(min(start_x, end_x), min(max(start_x, end_x), target_x + variation))
+            target_x = start_x + span_x * progress
+            variation = jitter_x * (rng.random() - 0.5)
+            target_x = max(lo_x, min(hi_x, target_x + variation))
             waypoints.append((target_x, current_y))
             current_x = target_x
         else:
-            target_y = start_y + (end_y - start_y) * progress
-            variation = (end_y - start_y) * 0.4 * (np.random.random() - 0.5)
-            target_y = max(min(start_y, end_y), min(max(start_y, end_y), target_y + variation))
+            target_y = start_y + span_y * progress
+            variation = jitter_y * (rng.random() - 0.5)
+            target_y = max(lo_y, min(hi_y, target_y + variation))
             waypoints.append((current_x, target_y))
             current_y = target_y
 
@@ -246,13 +289,33 @@ def route_manhattan(
     return waypoints
 
 
+def get_or_create_net(board: "pcbnew.BOARD", net_name: str) -> "pcbnew.NETINFO_ITEM":
+    """
+    Look up a net on the board by name, adding it if it does not exist yet.
+
+    Args:
+        board: KiCad BOARD object
+        net_name: Net name
+
+    Returns:
+        NETINFO_ITEM for the net
+    """
+    net = board.GetNetInfo().GetNetItem(net_name)
+    if net is None:
+        # Create new net
+        net = pcbnew.NETINFO_ITEM(board, net_name)
+        board.Add(net)
+    return net
+
+
 def create_pcb_track(
     board: "pcbnew.BOARD",
     start: Tuple[float, float],
     end: Tuple[float, float],
     width: float,
     layer: int,
-    net_name: str = None
+    net_name: str = None,
+    net_item: "pcbnew.NETINFO_ITEM" = None
 ) -> "pcbnew.PCB_TRACK":
     """
     Create a PCB track segment.
@@ -263,7 +326,8 @@ def create_pcb_track(
         end: (x, y) end position in mm
         width: Track width in mm
         layer: PCB layer
-        net_name: Optional net name
+        net_name: Optional net name (looked up on every call)
+        net_item: Optional already-resolved net, takes precedence over net_name
 
     Returns:
         Created PCB_TRACK object
@@ -282,24 +346,65 @@ def create_pcb_track(
     track.SetLayer(int(layer))
 
     # Set net if provided
-    if net_name:
-        netinfo = board.GetNetInfo()
-        net = netinfo.GetNetItem(net_name)
-        if net is None:
-            # Create new net
-            net = pcbnew.NETINFO_ITEM(board, net_name)
-            board.Add(net)
-        track.SetNet(net)
+    if net_item is None and net_name:
+        net_item = get_or_create_net(board, net_name)
+    if net_item is not None:
+        track.SetNet(net_item)
 
     board.Add(track)
     return track
 
 
+def add_track_path(
+    board: "pcbnew.BOARD",
+    waypoints: List[Tuple[float, float]],
+    width: float,
+    layer: int,
+    net_item: "pcbnew.NETINFO_ITEM" = None
+) -> List["pcbnew.PCB_TRACK"]:
+    """
+    Create one track segment between each pair of consecutive waypoints.
+
+    Same result as calling create_pcb_track per segment, but every waypoint
+    and the width are converted to internal units once - consecutive
+    segments share their end/start point.
+
+    Args:
+        board: KiCad BOARD object
+        waypoints: (x, y) positions in mm
+        width: Track width in mm
+        layer: PCB layer
+        net_item: Optional net (see get_or_create_net)
+
+    Returns:
+        Created PCB_TRACK objects
+    """
+    points = [pcbnew.VECTOR2I(pcbnew.FromMM(float(x)), pcbnew.FromMM(float(y)))
+              for x, y in waypoints]
+    width_iu = pcbnew.FromMM(float(width))
+    layer = int(layer)
+
+    tracks = []
+    for start, end in zip(points, points[1:]):
+        track = pcbnew.PCB_TRACK(board)
+        track.SetStart(start)
+        track.SetEnd(end)
+        track.SetWidth(width_iu)
+        track.SetLayer(layer)
+        if net_item is not None:
+            track.SetNet(net_item)
+        board.Add(track)
+        tracks.append(track)
+
+    return tracks
+
+
 def route_net(
     board: "pcbnew.BOARD",
     net: Net,
     placements: List[ComponentPlacement],
-    params: Optional[Dict] = None
+    params: Optional[Dict] = None,
+    rng: Optional[random.Random] = None
 ):
     """
     Route a single net connecting multiple pads.
@@ -309,9 +414,12 @@ def route_net(
         net: Net object with pads to connect
         placements: List of all component placements
         params: Routing parameters
+        rng: Random number generator (module-level random if None)
     """
     if params is None:
         params = {}
+    if rng is None:
+        rng = random
 
     if len(net.pads) < 2:
         return
@@ -322,74 +430,76 @@ def route_net(
     elif net.net_type == 'ground':
         track_width = params.get('ground_track_width', 0.4)
     else:
-        track_width = np.random.choice([0.2, 0.25, 0.3], p=[0.5, 0.3, 0.2])
-
-    # Use nearest neighbor to connect pads
-    routed_pads = [net.pads[0]]
-    unrouted_pads = list(net.pads[1:])
-
-    while unrouted_pads:
-        # Find closest unrouted pad to any routed pad
-        min_dist = float('inf')
-        best_routed = None
-        best_unrouted = None
-
-        for routed_comp_idx, routed_pin in routed_pads:
-            routed_pos = get_component_pad_position(placements[routed_comp_idx], routed_pin)
-
-            for unrouted_comp_idx, unrouted_pin in unrouted_pads:
-                unrouted_pos = get_component_pad_position(placements[unrouted_comp_idx], unrouted_pin)
-
-                dist = np.sqrt((routed_pos[0] - unrouted_pos[0])**2 +
-                              (routed_pos[1] - unrouted_pos[1])**2)
-
-                if dist < min_dist:
-                    min_dist = dist
-                    best_routed = (routed_comp_idx, routed_pin, routed_pos)
-                    best_unrouted = (unrouted_comp_idx, unrouted_pin, unrouted_pos)
-
-        if best_unrouted is None:
+        # Weighted choice by bisecting the precomputed CDF
+        track_width = _SIGNAL_TRACK_WIDTHS[bisect.bisect_right(_SIGNAL_TRACK_WIDTH_CDF, rng.random())]
+
+    # Resolve the net once; every segment of every connection shares it
+    net_item = get_or_create_net(board, net.name)
+
+    # Use nearest neighbor to connect pads (Prim's order). Pad positions are
+    # fixed, so each unrouted pad keeps its distance to the closest routed pad
+    # and only the newly routed pad's distances are computed per step
+    pad_positions = [get_component_pad_position(placements[comp_idx], pin)
+                     for comp_idx, pin in net.pads]
+    xy = np.array(pad_positions, dtype=float)
+
+    routed = np.zeros(len(net.pads), dtype=bool)
+    routed[0] = True
+    best_dist = np.sqrt((xy[0, 0] - xy[:, 0])**2 + (xy[0, 1] - xy[:, 1])**2)
+    best_from = np.zeros(len(net.pads), dtype=np.intp)  # routing order of the closest routed pad
+    routed_order = [0]
+
+    for step in range(1, len(net.pads)):
+        # Closest (routed, unrouted) pair; ties go to the earlier routed pad,
+        # then to the earlier unrouted pad
+        remaining = np.flatnonzero(~routed)
+        dists = best_dist[remaining]
+        tied = remaining[dists == dists.min()]
+        best_unrouted = int(tied[np.argmin(best_from[tied])])
+        best_routed = routed_order[best_from[best_unrouted]]
+
+        if not np.isfinite(best_dist[best_unrouted]):
             break
 
         # Route between best_routed and best_unrouted
-        start_pos = best_routed[2]
-        end_pos = best_unrouted[2]
-
-        distance = np.sqrt((end_pos[0] - start_pos[0])**2 + (end_pos[1] - start_pos[1])**2)
+        start_pos = pad_positions[best_routed]
+        end_pos = pad_positions[best_unrouted]
+        distance = best_dist[best_unrouted]
 
         # Choose routing style based on distance
-        route_choice = np.random.random()
+        route_choice = rng.random()
 
         if distance < 5.0:
             if route_choice < 0.5:
                 waypoints = [start_pos, end_pos]  # Straight
             else:
-                waypoints = route_dogleg(start_pos, end_pos)
+                waypoints = route_dogleg(start_pos, end_pos, rng=rng)
         elif distance < 20.0:
             if route_choice < 0.3:
                 waypoints = [start_pos, end_pos]
             elif route_choice < 0.6:
-                waypoints = route_dogleg(start_pos, end_pos)
+                waypoints = route_dogleg(start_pos, end_pos, rng=rng)
             else:
-                waypoints = route_manhattan(start_pos, end_pos, segments=np.random.randint(2, 4))
+                waypoints = route_manhattan(start_pos, end_pos, segments=rng.randrange(2, 4), rng=rng)
         else:
             if route_choice < 0.4:
-                waypoints = route_dogleg(start_pos, end_pos)
+                waypoints = route_dogleg(start_pos, end_pos, rng=rng)
             else:
-                waypoints = route_manhattan(start_pos, end_pos, segments=np.random.randint(3, 6))
+                waypoints = route_manhattan(start_pos, end_pos, segments=rng.randrange(3, 6), rng=rng)
 
         # Choose layer (prefer front copper for now)
         layer = pcbnew.F_Cu
 
         # Create track segments
-        for j in range(len(waypoints) - 1):
-            start = waypoints[j]
-            end = waypoints[j + 1]
-            create_pcb_track(board, start, end, track_width, layer, net.name)
+        add_track_path(board, waypoints, track_width, layer, net_item)
 
-        # Mark as routed
-        routed_pads.append((best_unrouted[0], best_unrouted[1]))
-        unrouted_pads.remove((best_unrouted[0], best_unrouted[1]))
+        # Mark as routed and relax the remaining pads against it
+        routed[best_unrouted] = True
+        routed_order.append(best_unrouted)
+        dist = np.sqrt((xy[best_unrouted, 0] - xy[:, 0])**2 + (xy[best_unrouted, 1] - xy[:, 1])**2)
+        closer = dist < best_dist
+        best_dist[closer] = dist[closer]
+        best_from[closer] = step
 
 
 def create_ground_pour(
@@ -420,11 +530,15 @@ def create_ground_pour(
         # Set zone outline (rectangle with margin)
         outline = pcbnew.SHAPE_POLY_SET()
 
+        # Only three distinct coordinates; convert each to internal units once
+        lo = pcbnew.FromMM(margin)
+        right = pcbnew.FromMM(board_width - margin)
+        bottom = pcbnew.FromMM(board_height - margin)
         points = [
-            pcbnew.VECTOR2I(pcbnew.FromMM(margin), pcbnew.FromMM(margin)),
-            pcbnew.VECTOR2I(pcbnew.FromMM(board_width - margin), pcbnew.FromMM(margin)),
-            pcbnew.VECTOR2I(pcbnew.FromMM(board_width - margin), pcbnew.FromMM(board_height - margin)),
-            pcbnew.VECTOR2I(pcbnew.FromMM(margin), pcbnew.FromMM(board_height - margin))
+            pcbnew.VECTOR2I(lo, lo),
+            pcbnew.VECTOR2I(right, lo),
+            pcbnew.VECTOR2I(right, bottom),
+            pcbnew.VECTOR2I(lo, bottom)
         ]
 
         outline.NewOutline()
@@ -460,7 +574,8 @@ def add_routing_to_board(
     placements: List[ComponentPlacement],
     board_width: float,
     board_height: float,
-    params: Optional[Dict] = None
+    params: Optional[Dict] = None,
+    seed: Optional[int] = None
 ) -> Dict:
     """
     Main function to add routing to a PCB board.
@@ -471,6 +586,7 @@ def add_routing_to_board(
         board_width: Board width in mm
         board_height: Board height in mm
         params: Routing parameters
+        seed: Seed for netlist and route generation (unseeded if None)
 
     Returns:
         Dictionary with routing statistics
@@ -486,14 +602,17 @@ def add_routing_to_board(
             'add_ground_pour': True,
         }
 
+    # Scalar draws only, so a stdlib generator is cheaper than NumPy's
+    rng = random.Random(seed)
+
     logger.info("Generating random netlists...")
-    nets = generate_random_netlists(placements, params)
+    nets = generate_random_netlists(placements, params, rng)
 
     logger.info(f"Routing {len(nets)} nets...")
     routed_count = 0
     for net in nets:
         try:
-            route_net(board, net, placements, params)
+            route_net(board, net, placements, params, rng)
             routed_count += 1
         except Exception as e:
             logger.warning(f"Failed to route net {net.name}: {e}")
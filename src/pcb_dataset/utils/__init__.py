@@ -5,7 +5,13 @@ Utility modules for PCB dataset generation.
 from pcb_dataset.utils.config import load_config, ConfigLoader
 from pcb_dataset.utils.logging import setup_logging, get_logger
 from pcb_dataset.utils.paths import PathManager
-from pcb_dataset.utils.validation import validate_kicad_file, validate_pcb3d_file, validate_hdf5_file
+from pcb_dataset.utils.validation import (
+    validate_file_size,
+    validate_kicad_file,
+    validate_pcb3d_file,
+    validate_hdf5_file,
+    validate_output,
+)
 
 __all__ = [
     "load_config",
@@ -13,7 +19,9 @@ __all__ = [
     "setup_logging",
     "get_logger",
     "PathManager",
+    "validate_file_size",
     "validate_kicad_file",
     "validate_pcb3d_file",
     "validate_hdf5_file",
+    "validate_output",
 ]
@@ -4,8 +4,23 @@ Configuration loading and management.
 
 from pathlib import Path
 from typing import Any, Dict
+import copy
+import functools
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it (same result, much faster)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@functools.lru_cache(maxsize=128)
+def _load_yaml(path_str: str, mtime_ns: int) -> Any:
+    """Parse a YAML file; cached per (path, mtime) so unchanged files parse once."""
+    with open(path_str, "r") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 
 class ConfigLoader:
     """Load and validate YAML configuration files."""
@@ -37,13 +52,14 @@ class ConfigLoader:
         """
         config_path = self.config_dir / f"{config_name}.yaml"
 
-        if not config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
-
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {config_path}") from None
 
-        return config
+        # Callers may mutate their config, so hand out a copy of the cached parse
+        config = _load_yaml(str(config_path.resolve()), mtime_ns)
+        return copy.deepcopy(config)
 
     def load_all(self) -> Dict[str, Dict[str, Any]]:
         """
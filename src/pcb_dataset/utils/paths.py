@@ -6,6 +6,11 @@ from pathlib import Path
 from typing import Dict, Optional
 
 
+def _sample_stem(sample_id: int) -> str:
+    """File stem shared by all of a sample's files (sample_000042)."""
+    return f"sample_{sample_id:06d}"
+
+
 class PathManager:
     """Manage file paths for the pipeline."""
 
@@ -44,31 +49,31 @@ class PathManager:
     def get_board_path(self, sample_id: int, board_name: Optional[str] = None) -> Path:
         """Get path for KiCad board file."""
         if board_name is None:
-            board_name = f"sample_{sample_id:06d}"
+            board_name = _sample_stem(sample_id)
         return self.boards_dir / f"{board_name}.kicad_pcb"
 
     def get_pcb3d_path(self, sample_id: int, board_name: Optional[str] = None) -> Path:
         """Get path for .pcb3d file."""
         if board_name is None:
-            board_name = f"sample_{sample_id:06d}"
+            board_name = _sample_stem(sample_id)
         return self.pcb3d_dir / f"{board_name}.pcb3d"
 
     def get_blend_path(self, sample_id: int, board_name: Optional[str] = None) -> Path:
         """Get path for Blender file."""
         if board_name is None:
-            board_name = f"sample_{sample_id:06d}"
+            board_name = _sample_stem(sample_id)
         return self.renders_dir / f"{board_name}.blend"
 
     def get_output_path(
         self, sample_id: int, resolution: int = 2048, format: str = "hdf5"
     ) -> Path:
         """Get path for output file."""
-        filename = f"sample_{sample_id:06d}_{resolution}x{resolution}.{format}"
+        filename = f"{_sample_stem(sample_id)}_{resolution}x{resolution}.{format}"
         return self.output_dir / filename
 
     def get_log_path(self, sample_id: int) -> Path:
         """Get path for sample log file."""
-        return self.logs_dir / f"sample_{sample_id:06d}.log"
+        return self.logs_dir / f"{_sample_stem(sample_id)}.log"
 
     def cleanup_sample(self, sample_id: int, keep_boards: bool, keep_pcb3d: bool, keep_blend: bool):
         """
@@ -80,21 +85,19 @@ class PathManager:
             keep_pcb3d: Keep .pcb3d file
             keep_blend: Keep .blend file
         """
+        stem = _sample_stem(sample_id)
+
         if not keep_boards:
-            board_path = self.get_board_path(sample_id)
-            if board_path.exists():
-                board_path.unlink()
+            board_path = self.get_board_path(sample_id, stem)
+            board_path.unlink(missing_ok=True)
 
         if not keep_pcb3d:
-            pcb3d_path = self.get_pcb3d_path(sample_id)
-            if pcb3d_path.exists():
-                pcb3d_path.unlink()
+            pcb3d_path = self.get_pcb3d_path(sample_id, stem)
+            pcb3d_path.unlink(missing_ok=True)
 
         if not keep_blend:
-            blend_path = self.get_blend_path(sample_id)
-            if blend_path.exists():
-                blend_path.unlink()
+            blend_path = self.get_blend_path(sample_id, stem)
+            blend_path.unlink(missing_ok=True)
             # Also remove backup files
             blend1_path = blend_path.with_suffix(".blend1")
-            if blend1_path.exists():
-                blend1_path.unlink()
+            blend1_path.unlink(missing_ok=True)
@@ -8,6 +8,43 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Signature at the start of every HDF5 file (no user block)
+HDF5_MAGIC = b"\x89HDF\r\n\x1a\n"
+
+# Default minimum sizes (MB) of each stage's output file
+PCB3D_MIN_SIZE_MB = 0.1
+HDF5_MIN_SIZE_MB = 1.0
+BLEND_MIN_SIZE_MB = 0.5
+
+
+def validate_file_size(file_path: Path, min_size_mb: float = 0.0) -> bool:
+    """
+    Cheap validation: check that a file exists and is large enough.
+
+    Uses a single stat() call and never opens the file.
+
+    Args:
+        file_path: Path to file
+        min_size_mb: Minimum expected file size in MB
+
+    Returns:
+        True if valid, False otherwise
+    """
+    try:
+        file_size = file_path.stat().st_size
+    except FileNotFoundError:
+        logger.error(f"File does not exist: {file_path}")
+        return False
+
+    if file_size == 0 or file_size < min_size_mb * (1 << 20):
+        logger.error(
+            f"File is too small ({file_size / (1 << 20):.2f} MB < {min_size_mb:.2f} MB): {file_path}"
+        )
+        return False
+
+    logger.debug(f"File size validated: {file_path} ({file_size / (1 << 20):.2f} MB)")
+    return True
+
 
 def validate_kicad_file(file_path: Path) -> bool:
     """
@@ -19,11 +56,13 @@ def validate_kicad_file(file_path: Path) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not file_path.exists():
+    try:
+        file_size = file_path.stat().st_size
+    except FileNotFoundError:
         logger.error(f"KiCad file does not exist: {file_path}")
         return False
 
-    if file_path.stat().st_size == 0:
+    if file_size == 0:
         logger.error(f"KiCad file is empty: {file_path}")
         return False
 
@@ -42,7 +81,7 @@ def validate_kicad_file(file_path: Path) -> bool:
     return True
 
 
-def validate_pcb3d_file(file_path: Path, min_size_mb: float = 0.1) -> bool:
+def validate_pcb3d_file(file_path: Path, min_size_mb: float = PCB3D_MIN_SIZE_MB) -> bool:
     """
     Validate a .pcb3d file.
 
@@ -53,11 +92,11 @@ def validate_pcb3d_file(file_path: Path, min_size_mb: float = 0.1) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not file_path.exists():
+    try:
+        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+    except FileNotFoundError:
         logger.error(f".pcb3d file does not exist: {file_path}")
         return False
-
-    file_size_mb = file_path.stat().st_size / (1024 * 1024)
     if file_size_mb < min_size_mb:
         logger.error(
             f".pcb3d file is too small ({file_size_mb:.2f} MB < {min_size_mb:.2f} MB): {file_path}"
@@ -79,44 +118,64 @@ def validate_pcb3d_file(file_path: Path, min_size_mb: float = 0.1) -> bool:
     return True
 
 
-def validate_hdf5_file(file_path: Path, min_size_mb: float = 1.0, check_keys: bool = True) -> bool:
+def validate_hdf5_file(
+    file_path: Path, min_size_mb: float = HDF5_MIN_SIZE_MB, check_keys: bool = True
+) -> bool:
     """
     Validate an HDF5 output file.
 
     Args:
         file_path: Path to .hdf5 file
         min_size_mb: Minimum expected file size in MB
-        check_keys: Whether to check for expected data keys
+        check_keys: Whether to check for expected data keys (only this opens
+            the file with h5py; otherwise just the signature is checked)
 
     Returns:
         True if valid, False otherwise
     """
-    if not file_path.exists():
+    try:
+        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+    except FileNotFoundError:
         logger.error(f"HDF5 file does not exist: {file_path}")
         return False
-
-    file_size_mb = file_path.stat().st_size / (1024 * 1024)
     if file_size_mb < min_size_mb:
         logger.error(
             f"HDF5 file is too small ({file_size_mb:.2f} MB < {min_size_mb:.2f} MB): {file_path}"
         )
         return False
 
+    # HDF5 files start with an 8-byte signature
+    try:
+        with open(file_path, "rb") as f:
+            magic = f.read(8)
+            if magic != HDF5_MAGIC:
+                logger.error(f"HDF5 file has invalid magic bytes: {file_path}")
+                return False
+    except Exception as e:
+        logger.error(f"Error reading HDF5 file {file_path}: {e}")
+        return False
+
+    if not check_keys:
+        logger.debug(f"HDF5 file validated: {file_path} ({file_size_mb:.2f} MB)")
+        return True
+
     # Check HDF5 structure
     try:
         with h5py.File(file_path, "r") as f:
             # BlenderProc HDF5 files have a specific structure
             # Expected keys: colors, depth, category_id_segmaps, etc.
-            if check_keys:
-                expected_keys = ["colors", "depth"]
-                missing_keys = [key for key in expected_keys if key not in f.keys()]
-
-                if missing_keys:
-                    logger.warning(
-                        f"HDF5 file missing expected keys {missing_keys}: {file_path}"
-                    )
-                    # Don't fail on missing keys, just warn
-                    # Some renders may not have all data types
+            # Depth is float "depth", "depth_u8" or both (depth.store_float)
+            keys = f.keys()
+            missing_keys = [] if "colors" in keys else ["colors"]
+            if "depth" not in keys and "depth_u8" not in keys:
+                missing_keys.append("depth")
+
+            if missing_keys:
+                logger.warning(
+                    f"HDF5 file missing expected keys {missing_keys}: {file_path}"
+                )
+                # Don't fail on missing keys, just warn
+                # Some renders may not have all data types
 
     except Exception as e:
         logger.error(f"Error reading HDF5 file {file_path}: {e}")
@@ -126,7 +185,7 @@ def validate_hdf5_file(file_path: Path, min_size_mb: float = 1.0, check_keys: bo
     return True
 
 
-def validate_blend_file(file_path: Path, min_size_mb: float = 0.5) -> bool:
+def validate_blend_file(file_path: Path, min_size_mb: float = BLEND_MIN_SIZE_MB) -> bool:
     """
     Validate a Blender .blend file.
 
@@ -137,11 +196,11 @@ def validate_blend_file(file_path: Path, min_size_mb: float = 0.5) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not file_path.exists():
+    try:
+        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+    except FileNotFoundError:
         logger.error(f"Blender file does not exist: {file_path}")
         return False
-
-    file_size_mb = file_path.stat().st_size / (1024 * 1024)
     if file_size_mb < min_size_mb:
         logger.error(
             f"Blender file is too small ({file_size_mb:.2f} MB < {min_size_mb:.2f} MB): {file_path}"
@@ -161,3 +220,35 @@ def validate_blend_file(file_path: Path, min_size_mb: float = 0.5) -> bool:
 
     logger.debug(f"Blender file validated: {file_path} ({file_size_mb:.2f} MB)")
     return True
+
+
+# Size-check minimum for each full validator (validate_kicad_file has none)
+_MIN_SIZE_MB = {
+    validate_pcb3d_file: PCB3D_MIN_SIZE_MB,
+    validate_hdf5_file: HDF5_MIN_SIZE_MB,
+    validate_blend_file: BLEND_MIN_SIZE_MB,
+}
+
+
+def validate_output(file_path: Path, validator, deep: bool = False, **kwargs) -> bool:
+    """
+    Validate a pipeline stage output file.
+
+    Only the file size is checked by default (one stat call); the full format
+    validator runs when deep is set (validation.deep_validate).
+
+    Args:
+        file_path: File to validate
+        validator: Full validator from this module (validate_kicad_file, ...)
+        deep: Run the full validator instead of the size check
+        **kwargs: Extra arguments for the validator; min_size_mb is also used
+            by the size check and defaults to the validator's minimum size
+
+    Returns:
+        True if valid, False otherwise
+    """
+    if deep:
+        return validator(file_path, **kwargs)
+
+    min_size_mb = kwargs.get("min_size_mb", _MIN_SIZE_MB.get(validator, 0.0))
+    return validate_file_size(file_path, min_size_mb)